@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the test suite.
+"""
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# RAM-backed filesystem used for test temp dirs when available (Linux)
+RAM_DISK = "/dev/shm"
+
+
+def pytest_configure(config):
+    """Put tmp_path directories on a RAM disk unless TMPDIR says otherwise."""
+    if os.environ.get("TMPDIR"):
+        return
+    if os.path.isdir(RAM_DISK) and os.access(RAM_DISK, os.W_OK):
+        tempfile.tempdir = RAM_DISK
+
+
+def _make_sized_file(file_path: Path, size: int) -> None:
+    """Create a file whose st_size is size without writing any data.
+    
+    The file is extended with truncate, so it is sparse on filesystems that
+    support it. Only for tests that look at the size, not the content.
+    
+    Args:
+        file_path: Path where to create the file
+        size: File size in bytes
+    """
+    file_path.touch()
+    os.truncate(file_path, size)
+
+
+@pytest.fixture(scope="session")
+def make_sized_file():
+    """Return the helper that creates a file of a given size."""
+    return _make_sized_file
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _configure_logging():
+    """Configure logging for tests to avoid noise."""
+    logging.basicConfig(level=logging.WARNING)
@@ -17,7 +17,7 @@ import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 try:
     from PIL import Image
@@ -34,6 +34,7 @@ except ImportError:
     MUTAGEN_AVAILABLE = False
     print("Warning: mutagen not installed. Video metadata extraction will be unavailable.")
 
+from file_walk import iter_files
 from mp4_metadata import set_mp4_creation_time
 
 IMAGE_EXTENSIONS = {
@@ -83,18 +84,6 @@ def normalize_extension(value: str) -> str:
     return ext
 
 
-def iter_source_files(source_dir: Path, recursive: bool) -> Iterable[Path]:
-    """Yield files from the source directory."""
-    if recursive:
-        iterator = source_dir.rglob('*')
-    else:
-        iterator = source_dir.glob('*')
-
-    for path in iterator:
-        if path.is_file():
-            yield path
-
-
 def parse_exif_datetime(date_str: str) -> Optional[datetime]:
     """Parse EXIF datetime string to datetime object."""
     try:
@@ -397,8 +386,16 @@ def build_handbrake_command(
 
 def is_subpath(path: Path, parent: Path) -> bool:
     """Return True if path is within parent."""
+    return is_relative_to(path.resolve(), parent.resolve())
+
+
+def is_relative_to(path: Path, parent: Path) -> bool:
+    """Return True if path is within parent, comparing the paths as given.
+
+    Callers resolve both paths first. Same as Path.is_relative_to (Python 3.9+).
+    """
     try:
-        path.resolve().relative_to(parent.resolve())
+        path.relative_to(parent)
         return True
     except ValueError:
         return False
@@ -428,17 +425,34 @@ def convert_videos(
         'errors': [],
     }
 
-    extensions_set = set(extensions)
+    extensions_set = frozenset(extensions)
     destination_in_source = is_subpath(destination_dir, source_dir)
+    destination_resolved = destination_dir.resolve() if destination_in_source else None
+    # Whether each scanned directory lies in the destination, resolved once
+    # per directory rather than once per file
+    dir_in_destination: Dict[str, bool] = {}
 
-    for file_path in iter_source_files(source_dir, recursive):
+    for entry in iter_files(source_dir, recursive):
         stats['scanned'] += 1
 
-        if destination_in_source and is_subpath(file_path, destination_dir):
+        # Filter on the raw entry name first so non-matching files never
+        # get a Path object or a resolve() call
+        if os.path.splitext(entry.name)[1].lower() not in extensions_set:
             continue
 
-        if file_path.suffix.lower() not in extensions_set:
-            continue
+        file_path = Path(entry.path)
+        if destination_in_source:
+            if entry.is_symlink():
+                # A symlinked file may point into the destination on its own
+                in_destination = is_relative_to(file_path.resolve(), destination_resolved)
+            else:
+                parent = os.path.dirname(entry.path)
+                in_destination = dir_in_destination.get(parent)
+                if in_destination is None:
+                    in_destination = is_relative_to(Path(parent).resolve(), destination_resolved)
+                    dir_in_destination[parent] = in_destination
+            if in_destination:
+                continue
 
         stats['matched'] += 1
         output_path = build_output_path(
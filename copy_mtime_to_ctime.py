@@ -18,6 +18,7 @@ import sys
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+from file_walk import iter_files
 from mp4_metadata import set_mp4_creation_time
 
 # Extensions for which we try to update container creation_time metadata
@@ -164,9 +165,7 @@ def collect_files(path: Path, recursive: bool) -> List[Path]:
         return [path]
     if not path.is_dir():
         return []
-    if not recursive:
-        return [p for p in path.iterdir() if p.is_file()]
-    return [p for p in path.rglob("*") if p.is_file()]
+    return [Path(entry.path) for entry in iter_files(path, recursive)]
 
 
 def copy_mtime_to_ctime(
@@ -199,6 +198,7 @@ def copy_mtime_to_ctime(
 
     for f in files:
         processed += 1
+        is_mp4 = _is_mp4_video(f)
         try:
             st = f.stat()
             mtime = st.st_mtime
@@ -209,14 +209,14 @@ def copy_mtime_to_ctime(
 
         if dry_run:
             logging.info(f"[DRY RUN] Would set creation time of {f} to mtime {mtime}")
-            if _is_mp4_video(f):
+            if is_mp4:
                 logging.info(f"[DRY RUN] Would set MP4 creation_time metadata: {f}")
             updated += 1
             continue
 
         fs_ok = set_creation_time_from_mtime(f, mtime)
         meta_ok = False
-        if _is_mp4_video(f):
+        if is_mp4:
             meta_ok = _set_mp4_creation_time_metadata(f, mtime)
             if meta_ok:
                 logging.info(f"Set MP4 creation_time metadata: {f}")
@@ -227,11 +227,11 @@ def copy_mtime_to_ctime(
             updated += 1
         else:
             skipped += 1
-            if system not in ("Windows", "Darwin") and not _is_mp4_video(f):
+            if system not in ("Windows", "Darwin") and not is_mp4:
                 pass  # already logged platform warning for fs; MP4 may have no ffmpeg
-            elif system in ("Windows", "Darwin") and not _is_mp4_video(f):
+            elif system in ("Windows", "Darwin") and not is_mp4:
                 logging.warning(f"Could not set creation time: {f}")
-            elif _is_mp4_video(f) and not fs_ok and not meta_ok:
+            elif is_mp4 and not fs_ok and not meta_ok:
                 logging.warning(f"Could not set creation time or MP4 metadata: {f}")
 
     return processed, updated, skipped
@@ -14,6 +14,11 @@ import sys
 from pathlib import Path
 from typing import List, Optional
 
+# Files starting with this prefix and smaller than DELETABLE_MAX_SIZE bytes
+# are deleted (macOS "._" resource-fork files, which are at most 4KB)
+DELETABLE_PREFIX = "._"
+DELETABLE_MAX_SIZE = 4500
+
 
 def setup_logging(log_file: Optional[Path] = None, verbose: bool = False) -> None:
     """Configure logging to file and console."""
@@ -30,6 +35,19 @@ def setup_logging(log_file: Optional[Path] = None, verbose: bool = False) -> Non
     )
 
 
+def is_deletable(name: str, size: int) -> bool:
+    """Check whether a file matches the deletion criteria.
+    
+    Args:
+        name: File name (not the full path)
+        size: File size in bytes
+        
+    Returns:
+        True if the file starts with '._' and is under DELETABLE_MAX_SIZE bytes
+    """
+    return name.startswith(DELETABLE_PREFIX) and size < DELETABLE_MAX_SIZE
+
+
 def remove_bad_characters_from_filename(dir1: str, file: str, file_name_index: int, 
                                        file_path: Path, root: Path) -> Path:
     """Rename files with problematic characters in their names."""
@@ -76,8 +94,10 @@ def delete_by_filename(source_path: Path, output_file: Optional[Path] = None,
                     )
                     file_name_index += 1
                     
-                    # Check if file matches deletion criteria
-                    if file.startswith("._") and file_path.stat().st_size < 4500:
+                    # Check if file matches deletion criteria; only files
+                    # with the prefix need a stat() for their size
+                    if (file.startswith(DELETABLE_PREFIX)
+                            and is_deletable(file, file_path.stat().st_size)):
                         deleted_files.append(str(file_path))
                         
                         if not dry_run:
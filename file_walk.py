@@ -0,0 +1,63 @@
+"""
+Walk directory trees with os.scandir.
+
+Used by organize_by_date, convert_videos, copy_mtime_to_ctime and verify_backup
+to list files without a stat() call per directory entry.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Iterator, List, Optional, Union
+
+
+def iter_files(root: Union[str, Path], recursive: bool = True,
+               unreadable: Optional[List[str]] = None) -> Iterator[os.DirEntry]:
+    """Yield directory entries for the files under a directory.
+
+    File types come from the cached directory entries instead of a stat() per
+    item, and each entry caches its stat() result for the caller (free on
+    Windows). Like rglob, symlinked directories are not descended into and
+    directories that cannot be read for lack of permission are skipped with a
+    warning. Any other OSError propagates.
+
+    The root directory is opened before this returns, so a missing root raises
+    here rather than on first iteration.
+
+    Args:
+        root: Directory to scan
+        recursive: If True, include files in subdirectories
+        unreadable: Optional list that skipped directory paths are appended to
+
+    Returns:
+        Iterator of os.DirEntry for each file found
+    """
+    scandir_it = _open_next([str(root)], unreadable)
+    return _iter_entries(scandir_it, recursive, unreadable)
+
+
+def _open_next(stack: List[str], unreadable: Optional[List[str]]):
+    """Pop directories off the stack until one can be opened; None when exhausted."""
+    while stack:
+        dir_path = stack.pop()
+        try:
+            return os.scandir(dir_path)
+        except PermissionError as e:
+            logging.warning(f"Cannot read directory {dir_path}: {e}")
+            if unreadable is not None:
+                unreadable.append(dir_path)
+    return None
+
+
+def _iter_entries(scandir_it, recursive: bool,
+                  unreadable: Optional[List[str]]) -> Iterator[os.DirEntry]:
+    """Yield files from an open scandir iterator and the directories it leads to."""
+    stack: List[str] = []
+    while scandir_it is not None:
+        with scandir_it as entries:
+            for entry in entries:
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+        scandir_it = _open_next(stack, unreadable)
@@ -10,10 +10,13 @@ video metadata for videos, file timestamps for all other files).
 import argparse
 import hashlib
 import logging
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
+
+from file_walk import iter_files
 
 try:
     from PIL import Image
@@ -31,10 +34,28 @@ except ImportError:
 
 
 # Supported file extensions
-IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', 
-                    '.heic', '.heif', '.raw', '.cr2', '.nef', '.orf', '.sr2'}
-VIDEO_EXTENSIONS = {'.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv', '.webm', 
-                    '.m4v', '.mpg', '.mpeg', '.3gp', '.mts', '.m2ts'}
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', 
+                              '.heic', '.heif', '.raw', '.cr2', '.nef', '.orf', '.sr2'})
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv', '.webm', 
+                              '.m4v', '.mpg', '.mpeg', '.3gp', '.mts', '.m2ts'})
+
+# Read size used when hashing files for duplicate detection
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Bytes compared at each end of two same-sized files before hashing them
+EDGE_COMPARE_SIZE = 64 * 1024
+
+# hashlib.file_digest (Python 3.11+) runs the read/update loop in C
+FILE_DIGEST = getattr(hashlib, 'file_digest', None)
+
+# Hashes only detect duplicate files, so they are flagged as not used for
+# security (Python 3.9+), which keeps them usable on FIPS-restricted builds
+SHA256_KWARGS = {'usedforsecurity': False} if sys.version_info >= (3, 9) else {}
+
+
+def new_sha256():
+    """Create a SHA256 hasher for duplicate detection."""
+    return hashlib.sha256(**SHA256_KWARGS)
 
 
 def setup_logging(log_file: Optional[Path] = None, verbose: bool = False) -> None:
@@ -171,18 +192,93 @@ def calculate_file_hash(file_path: Path) -> str:
     Returns:
         Hexadecimal string representation of the hash
     """
-    sha256_hash = hashlib.sha256()
+    sha256_hash = new_sha256()
     try:
-        with open(file_path, "rb") as f:
-            # Read file in chunks to handle large files efficiently
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+        with open(file_path, "rb", buffering=0) as f:
+            if hasattr(os, 'posix_fadvise'):
+                # Let the kernel ramp up readahead for the front-to-back read
+                try:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    # Only a hint; some filesystems and file types reject it
+                    pass
+            
+            if FILE_DIGEST is not None:
+                return FILE_DIGEST(f, new_sha256).hexdigest()
+            
+            # Read file in chunks into one reused buffer to handle large
+            # files efficiently without allocating a new bytes object per chunk
+            buffer = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+            for size in iter(lambda: f.readinto(buffer), 0):
+                sha256_hash.update(view[:size])
         return sha256_hash.hexdigest()
     except Exception as e:
         logging.debug(f"Failed to hash {file_path}: {e}")
         return ""
 
 
+def edges_differ(file_a: Path, file_b: Path, size: int) -> bool:
+    """Check whether two same-sized files differ in their first or last bytes.
+    
+    Re-encoded or edited media usually changes the header or the tail, so this
+    rejects most same-sized, non-identical pairs without reading them fully.
+    A False result proves nothing; the files still need a full comparison.
+    
+    Args:
+        file_a: First file
+        file_b: Second file
+        size: Size of both files in bytes
+        
+    Returns:
+        True if the files are known to differ, False otherwise
+    """
+    if size <= 2 * EDGE_COMPARE_SIZE:
+        # Small enough that hashing the whole file is just as cheap
+        return False
+    
+    try:
+        with open(file_a, "rb") as fa, open(file_b, "rb") as fb:
+            if fa.read(EDGE_COMPARE_SIZE) != fb.read(EDGE_COMPARE_SIZE):
+                return True
+            fa.seek(-EDGE_COMPARE_SIZE, os.SEEK_END)
+            fb.seek(-EDGE_COMPARE_SIZE, os.SEEK_END)
+            return fa.read(EDGE_COMPARE_SIZE) != fb.read(EDGE_COMPARE_SIZE)
+    except OSError as e:
+        logging.debug(f"Failed to compare {file_a} and {file_b}: {e}")
+        return False
+
+
+def cached_file_hash(file_path: Path, file_stat: os.stat_result,
+                     hash_cache: Optional[Dict[Tuple[int, int, int, int], str]]) -> str:
+    """Hash a file, reusing an earlier result for the same file in this run.
+    
+    Files are identified by (device, inode, size, mtime_ns), so hardlinks and
+    a destination file compared against several same-named sources are only
+    read once.
+    
+    Args:
+        file_path: Path to the file to hash
+        file_stat: stat() result for the file
+        hash_cache: Run-scoped cache dictionary, or None to disable caching
+        
+    Returns:
+        Hexadecimal string representation of the hash
+    """
+    # DirEntry.stat() on Windows leaves st_ino as 0, which can't identify a file
+    if hash_cache is None or not file_stat.st_ino:
+        return calculate_file_hash(file_path)
+    
+    key = (file_stat.st_dev, file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+    file_hash = hash_cache.get(key)
+    if file_hash is None:
+        file_hash = calculate_file_hash(file_path)
+        # Failed hashes ("") are not cached, so a later call can retry
+        if file_hash:
+            hash_cache[key] = file_hash
+    return file_hash
+
+
 def find_unique_filename(dest_folder: Path, base_name: str) -> Path:
     """Find a unique filename by appending numbers if needed.
     
@@ -217,19 +313,21 @@ def find_unique_filename(dest_folder: Path, base_name: str) -> Path:
             raise ValueError(f"Could not find unique filename for {base_name} after 10000 attempts")
 
 
-def get_file_timestamps(file_path: Path) -> Tuple[datetime, datetime]:
+def get_file_timestamps(file_path: Path,
+                        file_stat: Optional[os.stat_result] = None) -> Tuple[datetime, datetime]:
     """Get file creation and modification timestamps.
     
     Returns (creation_time, modification_time) tuple.
     On Windows, creation_time is more reliable.
+    Pass file_stat (e.g. from a directory scan) to skip the stat() call.
     """
-    stat = file_path.stat()
+    stat = file_stat if file_stat is not None else file_path.stat()
     creation_time = datetime.fromtimestamp(stat.st_ctime)
     modification_time = datetime.fromtimestamp(stat.st_mtime)
     return creation_time, modification_time
 
 
-def get_file_date(file_path: Path) -> datetime:
+def get_file_date(file_path: Path, file_stat: Optional[os.stat_result] = None) -> datetime:
     """Get the earliest available date for a file.
     
     Priority order:
@@ -237,36 +335,48 @@ def get_file_date(file_path: Path) -> datetime:
     2. Video metadata (for videos)
     3. File creation time
     4. File modification time
+    
+    file_stat, if given, is used for the timestamp fallback instead of stat().
     """
-    # Try EXIF for images
-    if file_path.suffix.lower() in IMAGE_EXTENSIONS:
+    # Image and video extensions are disjoint, so one lowered suffix picks the branch
+    suffix = file_path.suffix.lower()
+    
+    if suffix in IMAGE_EXTENSIONS:
+        # Try EXIF for images
         exif_date = get_exif_date(file_path)
         if exif_date:
             return exif_date
-    
-    # Try metadata for videos
-    if file_path.suffix.lower() in VIDEO_EXTENSIONS:
+    elif suffix in VIDEO_EXTENSIONS:
+        # Try metadata for videos
         video_date = get_video_metadata_date(file_path)
         if video_date:
             return video_date
     
     # Fall back to file timestamps
-    creation_time, modification_time = get_file_timestamps(file_path)
+    creation_time, modification_time = get_file_timestamps(file_path, file_stat)
     return min(creation_time, modification_time)
 
 
 def copy_file_to_dated_folder(source_file: Path, destination_root: Path, 
-                               dry_run: bool = False) -> Tuple[bool, str]:
+                               dry_run: bool = False,
+                               source_stat: Optional[os.stat_result] = None,
+                               hash_cache: Optional[Dict[Tuple[int, int, int, int], str]] = None
+                               ) -> Tuple[bool, str]:
     """Copy a file to the appropriate dated folder.
     
     If a file with the same name exists, compares hashes to determine if it's
     the same file. If different, appends a number to create a unique filename.
+    source_stat, if given, is reused instead of stat()ing the source again.
+    hash_cache, if given, memoizes hashes across calls (see cached_file_hash).
     
     Returns (success, message) tuple.
     """
     try:
+        if source_stat is None:
+            source_stat = source_file.stat()
+        
         # Get the date for the file
-        file_date = get_file_date(source_file)
+        file_date = get_file_date(source_file, source_stat)
         date_folder = file_date.strftime('%Y-%m-%d')
         
         # Create destination path
@@ -275,17 +385,22 @@ def copy_file_to_dated_folder(source_file: Path, destination_root: Path,
         
         # Check if file already exists
         if dest_file.exists():
-            # Calculate hashes to see if files are identical
-            source_hash = calculate_file_hash(source_file)
-            dest_hash = calculate_file_hash(dest_file)
+            # Files of different sizes can't be identical, so only read and
+            # hash both files when the sizes match and their ends agree
+            dest_stat = dest_file.stat()
+            if (source_stat.st_size == dest_stat.st_size
+                    and not edges_differ(source_file, dest_file, source_stat.st_size)):
+                # Calculate hashes to see if files are identical
+                source_hash = cached_file_hash(source_file, source_stat, hash_cache)
+                dest_hash = cached_file_hash(dest_file, dest_stat, hash_cache)
+                
+                # Only skip if both hashes were calculated successfully and they match
+                if source_hash and dest_hash and source_hash == dest_hash:
+                    # Files are identical, skip
+                    return True, f"Skipped (already exists, identical): {dest_file}"
             
-            # Only skip if both hashes were calculated successfully and they match
-            if source_hash and dest_hash and source_hash == dest_hash:
-                # Files are identical, skip
-                return True, f"Skipped (already exists, identical): {dest_file}"
-            else:
-                # Files are different or hash calculation failed, find a unique filename
-                dest_file = find_unique_filename(dest_folder, source_file.name)
+            # Files are different or hash calculation failed, find a unique filename
+            dest_file = find_unique_filename(dest_folder, source_file.name)
         
         # Create destination folder if needed
         if not dry_run:
@@ -328,16 +443,21 @@ def organize_files(source_dir: Path, destination_dir: Path,
     logging.info(f"Dry run: {dry_run}")
     logging.info("Processing all file types")
     
+    # Hashes computed during this run, keyed by file identity
+    hash_cache: Dict[Tuple[int, int, int, int], str] = {}
+    
     # Recursively find all files
-    for file_path in source_dir.rglob('*'):
-        if not file_path.is_file():
-            continue
-        
+    for entry in iter_files(source_dir):
         stats['processed'] += 1
+        file_path = Path(entry.path)
         
-        # Copy file to dated folder
+        # Copy file to dated folder, reusing the entry's stat result
+        try:
+            file_stat = entry.stat()
+        except OSError:
+            file_stat = None
         success, message = copy_file_to_dated_folder(
-            file_path, destination_dir, dry_run
+            file_path, destination_dir, dry_run, file_stat, hash_cache
         )
         
         if success:
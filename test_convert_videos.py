@@ -5,8 +5,6 @@ Tests for convert_videos.py.
 
 import json
 import os
-import shutil
-import tempfile
 from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
@@ -25,15 +23,13 @@ from convert_videos import (
 
 
 @pytest.fixture
-def temp_dirs():
+def temp_dirs(tmp_path):
     """Create temporary source and destination directories for testing."""
-    source_dir = Path(tempfile.mkdtemp(prefix='test_source_'))
-    dest_dir = Path(tempfile.mkdtemp(prefix='test_dest_'))
-
-    yield source_dir, dest_dir
-
-    shutil.rmtree(source_dir, ignore_errors=True)
-    shutil.rmtree(dest_dir, ignore_errors=True)
+    source_dir = tmp_path / "source"
+    dest_dir = tmp_path / "dest"
+    source_dir.mkdir()
+    dest_dir.mkdir()
+    return source_dir, dest_dir
 
 
 def create_test_file(file_path: Path, content: str = "test data",
@@ -158,5 +154,33 @@ def test_convert_videos_dry_run(temp_dirs):
     assert not (dest_dir / "clip2.mkv").exists()
 
 
+def test_convert_videos_skips_destination_inside_source(temp_dirs):
+    source_dir, _ = temp_dirs
+    dest_dir = source_dir / "converted"
+    create_test_file(source_dir / "clip1.mov")
+    create_test_file(source_dir / "trip" / "clip2.mov")
+    # Left over from an earlier run; must not be converted again
+    create_test_file(dest_dir / "trip" / "clip3.mov")
+
+    stats = convert_videos(
+        source_dir=source_dir,
+        destination_dir=dest_dir,
+        extensions=[".mov"],
+        output_extension=".mkv",
+        preset_file=None,
+        preset_name=None,
+        handbrake_cli="HandBrakeCLI",
+        handbrake_format=None,
+        extra_args=[],
+        recursive=True,
+        overwrite=False,
+        dry_run=True,
+    )
+
+    assert stats["scanned"] == 3
+    assert stats["matched"] == 2
+    assert stats["converted"] == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -6,7 +6,6 @@ Tests collection and dry-run behavior; actual creation-time setting is platform-
 """
 
 import os
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -15,17 +14,15 @@ from copy_mtime_to_ctime import collect_files, copy_mtime_to_ctime, set_creation
 
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Create temporary directory with a file."""
-    d = Path(tempfile.mkdtemp(prefix="test_copy_mtime_"))
+    d = tmp_path
     (d / "a.txt").write_text("a")
     (d / "b.txt").write_text("b")
     sub = d / "sub"
     sub.mkdir()
     (sub / "c.txt").write_text("c")
-    yield d
-    import shutil
-    shutil.rmtree(d, ignore_errors=True)
+    return d
 
 
 def test_collect_files_single_file(temp_dir):
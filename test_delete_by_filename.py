@@ -7,8 +7,6 @@ Works on both Linux and Windows.
 """
 
 import os
-import shutil
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -39,14 +37,9 @@ def create_test_file(file_path: Path, content: str = "test content",
 
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Create temporary directory for testing."""
-    test_dir = Path(tempfile.mkdtemp(prefix='test_delete_'))
-    
-    yield test_dir
-    
-    # Cleanup
-    shutil.rmtree(test_dir, ignore_errors=True)
+    return tmp_path
 
 
 def test_delete_files_matching_criteria(temp_dir):
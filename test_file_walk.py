@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for file_walk.py
+"""
+
+import errno
+import os
+from pathlib import Path
+
+import pytest
+
+from file_walk import iter_files
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Create a directory with files at the top level and in nested folders."""
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "sub" / "deeper").mkdir(parents=True)
+    (tmp_path / "sub" / "b.txt").write_text("b")
+    (tmp_path / "sub" / "deeper" / "c.txt").write_text("c")
+    (tmp_path / "other").mkdir()
+    (tmp_path / "other" / "d.txt").write_text("d")
+    return tmp_path
+
+
+def _relative_paths(root: Path, entries) -> set:
+    """Return the yielded file paths relative to root, with forward slashes."""
+    return {Path(entry.path).relative_to(root).as_posix() for entry in entries}
+
+
+def _deny(monkeypatch, denied: Path, error: OSError) -> None:
+    """Make os.scandir raise error for one directory."""
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if str(path) == str(denied):
+            raise error
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+
+
+def test_iter_files_recursive(tree):
+    """All files in the tree are yielded; directories are not."""
+    assert _relative_paths(tree, iter_files(tree)) == {
+        "a.txt", "sub/b.txt", "sub/deeper/c.txt", "other/d.txt",
+    }
+
+
+def test_iter_files_not_recursive(tree):
+    """Only top-level files are yielded when not recursive."""
+    assert _relative_paths(tree, iter_files(tree, recursive=False)) == {"a.txt"}
+
+
+def test_iter_files_accepts_str_root(tree):
+    """The root may be given as a string as well as a Path."""
+    assert _relative_paths(tree, iter_files(str(tree), recursive=False)) == {"a.txt"}
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Symlinks need extra privileges on Windows")
+def test_iter_files_does_not_follow_directory_symlinks(tree):
+    """Symlinked directories are not descended into; symlinked files are yielded."""
+    (tree / "link_dir").symlink_to(tree / "sub", target_is_directory=True)
+    (tree / "link.txt").symlink_to(tree / "a.txt")
+
+    assert _relative_paths(tree, iter_files(tree)) == {
+        "a.txt", "link.txt", "sub/b.txt", "sub/deeper/c.txt", "other/d.txt",
+    }
+
+
+def test_iter_files_skips_and_records_unreadable_directory(tree, monkeypatch):
+    """A directory that cannot be read for lack of permission is skipped and recorded."""
+    locked = tree / "sub"
+    _deny(monkeypatch, locked, PermissionError(errno.EACCES, "Permission denied", str(locked)))
+    unreadable = []
+
+    files = _relative_paths(tree, iter_files(tree, unreadable=unreadable))
+
+    assert files == {"a.txt", "other/d.txt"}
+    assert unreadable == [str(locked)]
+
+
+def test_iter_files_unreadable_root_yields_nothing(tree, monkeypatch):
+    """An unreadable root is recorded like any other unreadable directory."""
+    _deny(monkeypatch, tree, PermissionError(errno.EACCES, "Permission denied", str(tree)))
+    unreadable = []
+
+    assert list(iter_files(tree, unreadable=unreadable)) == []
+    assert unreadable == [str(tree)]
+
+
+def test_iter_files_propagates_other_errors(tree, monkeypatch):
+    """I/O errors other than a permission error abort the walk."""
+    failing = tree / "sub"
+    _deny(monkeypatch, failing, OSError(errno.EIO, "Input/output error", str(failing)))
+
+    with pytest.raises(OSError) as excinfo:
+        list(iter_files(tree))
+    assert excinfo.value.errno == errno.EIO
+
+
+def test_iter_files_missing_root_raises_on_call(tmp_path):
+    """A missing root raises when called, before any iteration."""
+    with pytest.raises(FileNotFoundError):
+        iter_files(tmp_path / "missing")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -6,118 +6,189 @@ Tests the script with sample data to verify it works correctly.
 Works on both Linux and Windows.
 """
 
+import errno
+import hashlib
 import os
-import shutil
-import tempfile
 from datetime import datetime
 from pathlib import Path
+from typing import Optional, Tuple
 
 import pytest
 
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
 # Import the module functions
-from organize_by_date import organize_files, get_file_date
+import organize_by_date
+from organize_by_date import calculate_file_hash, organize_files, get_file_date
+
+
+def _iso_mtime(year: int, month: int, day: int,
+               hour: int = 12, minute: int = 0) -> Tuple[str, float]:
+    """Return (dated folder name, mtime) for a local wall-clock time.
+    
+    The folder name is built directly rather than via strftime.
+    """
+    mtime = datetime(year, month, day, hour, minute).timestamp()
+    return f"{year:04d}-{month:02d}-{day:02d}", mtime
+
+
+# Expected date folder name -> file modification time, computed once at import
+DATES = dict([
+    _iso_mtime(2023, 1, 15, 10, 30),
+    _iso_mtime(2023, 2, 20, 14, 45),
+    _iso_mtime(2023, 3, 10, 9, 15),
+    _iso_mtime(2023, 5, 1),
+    _iso_mtime(2023, 6, 15, 10),
+    _iso_mtime(2023, 7, 1, 8),
+    _iso_mtime(2023, 8, 1),
+    _iso_mtime(2023, 9, 15, 15, 30),
+    _iso_mtime(2023, 10, 1, 10),
+    _iso_mtime(2023, 11, 1),
+])
 
 
 def create_test_file(file_path: Path, content: str = "test content", 
-                     timestamp: datetime = None) -> None:
+                     mtime: Optional[float] = None) -> None:
     """Create a test file with optional timestamp.
     
     Args:
         file_path: Path where to create the file
         content: Content to write to the file
-        timestamp: Optional datetime to set as file modification time
+        mtime: Optional seconds since the epoch to set as file modification time
     """
     file_path.parent.mkdir(parents=True, exist_ok=True)
     file_path.write_text(content, encoding='utf-8')
     
-    if timestamp:
+    if mtime is not None:
         # Set both modification and access time
         # Note: On Windows, we can only set mtime and atime, not ctime
-        timestamp_float = timestamp.timestamp()
-        os.utime(file_path, (timestamp_float, timestamp_float))
+        os.utime(file_path, (mtime, mtime))
 
 
-def create_test_image(file_path: Path, timestamp: datetime = None) -> None:
+def create_empty_file(file_path: Path, mtime: Optional[float] = None) -> None:
+    """Create a zero-length test file with optional timestamp.
+    
+    For tests that never read the content back; no data is written.
+    
+    Args:
+        file_path: Path where to create the file
+        mtime: Optional seconds since the epoch to set as file modification time
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    os.close(os.open(str(file_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC))
+    
+    if mtime is not None:
+        os.utime(file_path, (mtime, mtime))
+
+
+def create_test_image(file_path: Path, mtime: Optional[float] = None) -> None:
     """Create a simple test image file (PNG).
     
     Args:
         file_path: Path where to create the image
-        timestamp: Optional datetime to set as file modification time
+        mtime: Optional seconds since the epoch to set as file modification time
     """
-    try:
-        from PIL import Image
-        
-        # Create a simple 10x10 red image
-        img = Image.new('RGB', (10, 10), color='red')
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        img.save(file_path, 'PNG')
-        
-        if timestamp:
-            timestamp_float = timestamp.timestamp()
-            os.utime(file_path, (timestamp_float, timestamp_float))
-    except ImportError:
+    if not PIL_AVAILABLE:
         # If PIL is not available, create a dummy file
-        create_test_file(file_path, "fake image data", timestamp)
+        create_test_file(file_path, "fake image data", mtime)
+        return
+    
+    # Create a simple 10x10 red image
+    img = Image.new('RGB', (10, 10), color='red')
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    img.save(file_path, 'PNG')
+    
+    if mtime is not None:
+        os.utime(file_path, (mtime, mtime))
 
 
-def create_test_video(file_path: Path, timestamp: datetime = None) -> None:
+def create_test_video(file_path: Path, mtime: Optional[float] = None) -> None:
     """Create a dummy test video file.
     
     Args:
         file_path: Path where to create the video
-        timestamp: Optional datetime to set as file modification time
+        mtime: Optional seconds since the epoch to set as file modification time
     """
     # Create a dummy file with video extension
     # Real video metadata would require actual video encoding
-    create_test_file(file_path, "fake video data", timestamp)
+    create_empty_file(file_path, mtime)
 
 
 @pytest.fixture
-def temp_dirs():
+def temp_dirs(tmp_path):
     """Create temporary source and destination directories for testing."""
-    source_dir = Path(tempfile.mkdtemp(prefix='test_source_'))
-    dest_dir = Path(tempfile.mkdtemp(prefix='test_dest_'))
-    
-    yield source_dir, dest_dir
-    
-    # Cleanup
-    shutil.rmtree(source_dir, ignore_errors=True)
-    shutil.rmtree(dest_dir, ignore_errors=True)
+    source_dir = tmp_path / "source"
+    dest_dir = tmp_path / "dest"
+    source_dir.mkdir()
+    dest_dir.mkdir()
+    return source_dir, dest_dir
 
 
-def test_organize_files_by_timestamp(temp_dirs):
-    """Test that files are organized by their file timestamps."""
-    source_dir, dest_dir = temp_dirs
+@pytest.fixture(scope="session")
+def empty_dirs(tmp_path_factory):
+    """Create one empty source/destination pair shared by the whole session.
     
-    # Create test files with different dates
-    dates = [
-        datetime(2023, 1, 15, 10, 30, 0),
-        datetime(2023, 2, 20, 14, 45, 0),
-        datetime(2023, 3, 10, 9, 15, 0),
-    ]
+    Only suitable for tests that leave both directories untouched.
+    """
+    source_dir = tmp_path_factory.mktemp("empty_source", numbered=False)
+    dest_dir = tmp_path_factory.mktemp("empty_dest", numbered=False)
+    return source_dir, dest_dir
+
+
+# (source path relative to source_dir, DATES key, file factory)
+ORGANIZE_CASES = [
+    ("timestamp_grouping", [
+        ("test_file_0.txt", "2023-01-15", create_empty_file),
+        ("test_file_1.txt", "2023-02-20", create_empty_file),
+        ("test_file_2.txt", "2023-03-10", create_empty_file),
+    ]),
+    ("all_file_types", [
+        ("document.pdf", "2023-06-15", create_empty_file),
+        ("spreadsheet.xlsx", "2023-06-15", create_empty_file),
+        ("archive.zip", "2023-06-15", create_empty_file),
+        ("script.py", "2023-06-15", create_empty_file),
+        ("data.json", "2023-06-15", create_empty_file),
+    ]),
+    # Nested structure is not preserved in the destination
+    ("nested_directories", [
+        ("subdir/nested/nested_file.txt", "2023-07-01", create_empty_file),
+    ]),
+    # Images are processed even without EXIF
+    ("image_files", [
+        ("test_image.png", "2023-10-01", create_test_image),
+    ]),
+    ("video_files", [
+        ("test_video.mp4", "2023-11-01", create_test_video),
+    ]),
+]
+
+
+@pytest.mark.parametrize("entries", [entries for _, entries in ORGANIZE_CASES],
+                         ids=[name for name, _ in ORGANIZE_CASES])
+def test_organize_files(temp_dirs, entries):
+    """Test that files are copied into the date folder of their timestamp."""
+    source_dir, dest_dir = temp_dirs
     
-    files = []
-    for i, date in enumerate(dates):
-        file_path = source_dir / f"test_file_{i}.txt"
-        create_test_file(file_path, f"content {i}", date)
-        files.append(file_path)
+    for rel_path, folder, factory in entries:
+        factory(source_dir / rel_path, DATES[folder])
     
     # Run the organization
     stats = organize_files(source_dir, dest_dir, dry_run=False)
     
     # Verify statistics
-    assert stats['processed'] == 3
-    assert stats['copied'] == 3
+    assert stats['processed'] == len(entries)
+    assert stats['copied'] == len(entries)
     assert stats['failed'] == 0
     
-    # Verify files are in correct date folders
-    assert (dest_dir / "2023-01-15" / "test_file_0.txt").exists()
-    assert (dest_dir / "2023-02-20" / "test_file_1.txt").exists()
-    assert (dest_dir / "2023-03-10" / "test_file_2.txt").exists()
-    
-    # Verify source files still exist (script copies, not moves)
-    for file_path in files:
-        assert file_path.exists()
+    for rel_path, folder, _ in entries:
+        # Verify file is in correct date folder, flattened to its name
+        assert (dest_dir / folder / Path(rel_path).name).exists()
+        # Verify source file still exists (script copies, not moves)
+        assert (source_dir / rel_path).exists()
 
 
 def test_organize_dry_run(temp_dirs):
@@ -125,9 +196,9 @@ def test_organize_dry_run(temp_dirs):
     source_dir, dest_dir = temp_dirs
     
     # Create a test file
-    test_date = datetime(2023, 5, 1, 12, 0, 0)
+    folder = "2023-05-01"
     file_path = source_dir / "test.txt"
-    create_test_file(file_path, "test content", test_date)
+    create_empty_file(file_path, DATES[folder])
     
     # Run in dry-run mode
     stats = organize_files(source_dir, dest_dir, dry_run=True)
@@ -137,77 +208,19 @@ def test_organize_dry_run(temp_dirs):
     assert stats['copied'] == 1  # Counted as "would copy"
     
     # Verify file was NOT actually copied
-    assert not (dest_dir / "2023-05-01" / "test.txt").exists()
+    assert not (dest_dir / folder / "test.txt").exists()
     
     # Verify source file still exists
     assert file_path.exists()
 
 
-def test_organize_all_file_types(temp_dirs):
-    """Test that all file types are processed, not just images/videos."""
-    source_dir, dest_dir = temp_dirs
-    
-    test_date = datetime(2023, 6, 15, 10, 0, 0)
-    
-    # Create files of different types
-    files = {
-        'document.pdf': source_dir / "document.pdf",
-        'spreadsheet.xlsx': source_dir / "spreadsheet.xlsx",
-        'archive.zip': source_dir / "archive.zip",
-        'script.py': source_dir / "script.py",
-        'data.json': source_dir / "data.json",
-    }
-    
-    for file_path in files.values():
-        create_test_file(file_path, "test content", test_date)
-    
-    # Run the organization
-    stats = organize_files(source_dir, dest_dir, dry_run=False)
-    
-    # Verify all files were processed
-    assert stats['processed'] == len(files)
-    assert stats['copied'] == len(files)
-    
-    # Verify all files are in the same date folder
-    date_folder = dest_dir / "2023-06-15"
-    assert date_folder.exists()
-    
-    for filename, original_path in files.items():
-        assert (date_folder / filename).exists()
-
-
-def test_organize_nested_directories(temp_dirs):
-    """Test that files in nested directories are found and organized."""
-    source_dir, dest_dir = temp_dirs
-    
-    # Create nested directory structure
-    nested_dir = source_dir / "subdir" / "nested"
-    nested_dir.mkdir(parents=True, exist_ok=True)
-    
-    test_date = datetime(2023, 7, 1, 8, 0, 0)
-    file_path = nested_dir / "nested_file.txt"
-    create_test_file(file_path, "nested content", test_date)
-    
-    # Run the organization
-    stats = organize_files(source_dir, dest_dir, dry_run=False)
-    
-    # Verify file was found and organized
-    assert stats['processed'] == 1
-    assert stats['copied'] == 1
-    
-    # Verify file is in correct date folder (not preserving nested structure)
-    assert (dest_dir / "2023-07-01" / "nested_file.txt").exists()
-
-
 def test_skip_duplicate_files(temp_dirs):
     """Test that duplicate files (same name and content) are skipped."""
     source_dir, dest_dir = temp_dirs
     
-    test_date = datetime(2023, 8, 1, 12, 0, 0)
-    
     # Create a file and organize it
     file_path = source_dir / "duplicate.txt"
-    create_test_file(file_path, "content", test_date)
+    create_empty_file(file_path, DATES["2023-08-01"])
     
     stats1 = organize_files(source_dir, dest_dir, dry_run=False)
     assert stats1['copied'] == 1
@@ -223,19 +236,20 @@ def test_handle_different_files_same_name(temp_dirs):
     """Test that different files with the same name are renamed."""
     source_dir, dest_dir = temp_dirs
     
-    test_date = datetime(2023, 8, 1, 12, 0, 0)
+    folder = "2023-08-01"
+    mtime = DATES[folder]
     
     # Create first file and organize it
     file1 = source_dir / "same_name.txt"
-    create_test_file(file1, "content 1", test_date)
+    create_test_file(file1, "content 1", mtime)
     
     stats1 = organize_files(source_dir, dest_dir, dry_run=False)
     assert stats1['copied'] == 1
-    assert (dest_dir / "2023-08-01" / "same_name.txt").exists()
+    assert (dest_dir / folder / "same_name.txt").exists()
     
     # Create a different file with the same name
     file2 = source_dir / "subdir" / "same_name.txt"
-    create_test_file(file2, "different content", test_date)
+    create_test_file(file2, "different content", mtime)
     
     stats2 = organize_files(source_dir, dest_dir, dry_run=False)
     assert stats2['processed'] == 2  # Both files in source directory are processed
@@ -243,7 +257,7 @@ def test_handle_different_files_same_name(temp_dirs):
     assert stats2['skipped'] == 1  # First file is skipped (already exists, identical)
     
     # Should have both files - original and renamed version
-    date_folder = dest_dir / "2023-08-01"
+    date_folder = dest_dir / folder
     assert (date_folder / "same_name.txt").exists()
     assert (date_folder / "same_name_1.txt").exists()
     
@@ -252,14 +266,34 @@ def test_handle_different_files_same_name(temp_dirs):
     assert (date_folder / "same_name_1.txt").read_text() == "different content"
 
 
+def test_handle_same_size_different_content(temp_dirs):
+    """Test that same-size files with different content are still renamed."""
+    source_dir, dest_dir = temp_dirs
+    
+    folder = "2023-08-01"
+    mtime = DATES[folder]
+    
+    create_test_file(source_dir / "same_size.txt", "content A", mtime)
+    organize_files(source_dir, dest_dir, dry_run=False)
+    
+    # Same length as the first file, so only the hash tells them apart
+    create_test_file(source_dir / "subdir" / "same_size.txt", "content B", mtime)
+    stats = organize_files(source_dir, dest_dir, dry_run=False)
+    
+    assert stats['copied'] == 1
+    assert stats['skipped'] == 1
+    assert (dest_dir / folder / "same_size_1.txt").read_text() == "content B"
+
+
 def test_get_file_date_fallback(temp_dirs):
     """Test that get_file_date falls back to file timestamps."""
     source_dir, _ = temp_dirs
     
     # Create a non-image, non-video file
-    test_date = datetime(2023, 9, 15, 15, 30, 0)
+    mtime = DATES["2023-09-15"]
+    test_date = datetime.fromtimestamp(mtime)
     file_path = source_dir / "test.txt"
-    create_test_file(file_path, "test", test_date)
+    create_empty_file(file_path, mtime)
     
     # Get the file date
     file_date = get_file_date(file_path)
@@ -269,51 +303,102 @@ def test_get_file_date_fallback(temp_dirs):
     assert time_diff < 5, f"Date mismatch: {file_date} vs {test_date}"
 
 
-def test_organize_image_files(temp_dirs):
-    """Test that image files are processed (even without EXIF)."""
+def test_get_file_date_uses_given_stat(temp_dirs):
+    """Test that get_file_date takes timestamps from a supplied stat result."""
+    source_dir, _ = temp_dirs
+    
+    mtime = DATES["2023-09-15"]
+    file_path = source_dir / "scanned.txt"
+    create_empty_file(file_path, mtime)
+    file_stat = os.stat(file_path)
+    file_path.unlink()
+    
+    # The file is gone, so only the supplied stat can provide the date
+    file_date = get_file_date(file_path, file_stat)
+    
+    assert file_date == datetime.fromtimestamp(mtime)
+
+
+def test_organize_hashes_destination_once(temp_dirs, monkeypatch):
+    """Test that a destination file is hashed once for several same-named sources."""
     source_dir, dest_dir = temp_dirs
     
-    test_date = datetime(2023, 10, 1, 10, 0, 0)
+    # Two cameras produced the same file name with the same size, and a
+    # different file by that name is already in the destination
+    mtime = DATES["2023-09-15"]
+    dest_file = dest_dir / "2023-09-15" / "IMG_0001.txt"
+    create_test_file(dest_file, "DDDD", mtime)
+    create_test_file(source_dir / "camera_a" / "IMG_0001.txt", "AAAA", mtime)
+    create_test_file(source_dir / "camera_b" / "IMG_0001.txt", "BBBB", mtime)
     
-    # Create a test image
-    image_path = source_dir / "test_image.png"
-    create_test_image(image_path, test_date)
+    hashed = []
+    real_hash = organize_by_date.calculate_file_hash
     
-    # Run the organization
-    stats = organize_files(source_dir, dest_dir, dry_run=False)
+    def counting_hash(file_path):
+        hashed.append(file_path)
+        return real_hash(file_path)
     
-    # Verify image was processed
-    assert stats['processed'] == 1
-    assert stats['copied'] == 1
+    monkeypatch.setattr(organize_by_date, "calculate_file_hash", counting_hash)
     
-    # Verify image is in correct date folder
-    assert (dest_dir / "2023-10-01" / "test_image.png").exists()
+    stats = organize_files(source_dir, dest_dir, dry_run=True)
+    
+    assert stats['copied'] == 2
+    assert hashed.count(dest_file) == 1
 
 
-def test_organize_video_files(temp_dirs):
-    """Test that video files are processed."""
+def test_same_size_different_tail_skips_hashing(temp_dirs, monkeypatch):
+    """Test that same-sized files differing at the end are told apart without hashing."""
     source_dir, dest_dir = temp_dirs
     
-    test_date = datetime(2023, 11, 1, 12, 0, 0)
+    # Compare 4 bytes at each end so small files take the edge check
+    monkeypatch.setattr(organize_by_date, "EDGE_COMPARE_SIZE", 4)
+    hashed = []
+    monkeypatch.setattr(organize_by_date, "calculate_file_hash",
+                        lambda file_path: hashed.append(file_path) or "")
     
-    # Create a test video file
-    video_path = source_dir / "test_video.mp4"
-    create_test_video(video_path, test_date)
+    mtime = DATES["2023-09-15"]
+    create_test_file(dest_dir / "2023-09-15" / "clip.txt", "same start, tail A", mtime)
+    create_test_file(source_dir / "clip.txt", "same start, tail B", mtime)
     
-    # Run the organization
     stats = organize_files(source_dir, dest_dir, dry_run=False)
     
-    # Verify video was processed
-    assert stats['processed'] == 1
     assert stats['copied'] == 1
+    assert hashed == []
+    assert (dest_dir / "2023-09-15" / "clip_1.txt").read_text() == "same start, tail B"
+
+
+def test_calculate_file_hash_multiple_chunks(temp_dirs, monkeypatch):
+    """Test that hashing across several read chunks matches a one-shot SHA256."""
+    source_dir, _ = temp_dirs
+    
+    # Shrink the chunk size so a small file spans several reads, and take
+    # the Python read loop even where hashlib.file_digest is available
+    monkeypatch.setattr(organize_by_date, "HASH_CHUNK_SIZE", 4)
+    monkeypatch.setattr(organize_by_date, "FILE_DIGEST", None)
+    file_path = source_dir / "chunked.txt"
+    create_test_file(file_path, "0123456789")
+    
+    assert calculate_file_hash(file_path) == hashlib.sha256(b"0123456789").hexdigest()
+
+
+@pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="posix_fadvise not available")
+def test_calculate_file_hash_ignores_fadvise_error(temp_dirs, monkeypatch):
+    """Test that a rejected readahead hint does not stop the file being hashed."""
+    source_dir, _ = temp_dirs
+    
+    def failing_fadvise(fd, offset, length, advice):
+        raise OSError(errno.EINVAL, "Invalid argument")
     
-    # Verify video is in correct date folder
-    assert (dest_dir / "2023-11-01" / "test_video.mp4").exists()
+    monkeypatch.setattr(organize_by_date.os, "posix_fadvise", failing_fadvise)
+    file_path = source_dir / "hinted.txt"
+    create_test_file(file_path, "0123456789")
+    
+    assert calculate_file_hash(file_path) == hashlib.sha256(b"0123456789").hexdigest()
 
 
-def test_empty_source_directory(temp_dirs):
+def test_empty_source_directory(empty_dirs):
     """Test handling of empty source directory."""
-    source_dir, dest_dir = temp_dirs
+    source_dir, dest_dir = empty_dirs
     
     # Run on empty directory
     stats = organize_files(source_dir, dest_dir, dry_run=False)
@@ -7,9 +7,6 @@ Works on both Linux and Windows.
 """
 
 import os
-import shutil
-import tempfile
-from pathlib import Path
 
 import pytest
 
@@ -18,14 +15,9 @@ from rename_folders import rename_folders, convert_date_format
 
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Create temporary directory for testing."""
-    test_dir = Path(tempfile.mkdtemp(prefix='test_rename_'))
-    
-    yield test_dir
-    
-    # Cleanup
-    shutil.rmtree(test_dir, ignore_errors=True)
+    return tmp_path
 
 
 def test_rename_folder_with_date(temp_dir):
@@ -187,10 +179,10 @@ def test_rename_folder_name_cleaning(temp_dir):
     # Verify folder was renamed with cleaned name
     assert stats['renamed'] == 1
     # Should have date prefix and cleaned name
-    new_folder_name = list(temp_dir.glob("2023-10-20_*"))[0]
-    assert new_folder_name.exists()
-    assert "2023-10-20" in new_folder_name.name
-    assert "," not in new_folder_name.name
+    # Close the directory handle before teardown (matters on Windows)
+    with os.scandir(temp_dir) as it:
+        name = next(e.name for e in it if e.name.startswith("2023-10-20_"))
+    assert "," not in name
 
 
 def test_rename_empty_directory(temp_dir):
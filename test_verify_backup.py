@@ -5,14 +5,18 @@ Unit tests for verify_backup.py date parsing functions.
 Tests the date parsing functions for source and destination folder names.
 """
 
-import logging
+import errno
+import os
+import re
 import tempfile
 from pathlib import Path
 
 import pytest
 from datetime import datetime
 
+import verify_backup as verify_backup_module
 from verify_backup import (
+    MONTH_NAMES as MONTH_NUMBERS,
     generate_report,
     get_files_in_folder,
     parse_destination_folder_name,
@@ -23,10 +27,6 @@ from verify_backup import (
     verify_backup,
 )
 
-# Configure logging for tests to avoid noise
-logging.basicConfig(level=logging.WARNING)
-
-
 # Test data for parametrized tests
 MONTH_NAMES = [
     ("January", 1), ("February", 2), ("March", 3), ("April", 4),
@@ -70,24 +70,19 @@ def test_parse_source_folder_with_simple_description():
     assert description == "Description Text"
 
 
-@pytest.mark.parametrize("month_name,month_num", MONTH_NAMES)
-def test_parse_source_folder_all_month_names(month_name, month_num):
-    """Test parsing with all full month names."""
-    folder_name = f"{month_name} 15, 2023"
-    date, description = parse_source_folder_name(folder_name)
-    
-    assert date == datetime(2023, month_num, 15)
-    assert description is None
+def test_month_table_covers_all_names():
+    """Test that the parser's month table covers every full name and abbreviation."""
+    expected = {name.lower(): num for name, num in MONTH_NAMES + MONTH_ABBREVIATIONS}
+    assert expected.items() <= MONTH_NUMBERS.items()
 
 
-@pytest.mark.parametrize("abbrev,month_num", MONTH_ABBREVIATIONS)
-def test_parse_source_folder_month_abbreviations(abbrev, month_num):
-    """Test parsing with month abbreviations."""
-    folder_name = f"{abbrev} 20, 2023"
-    date, description = parse_source_folder_name(folder_name)
+def test_parse_source_folder_all_month_names():
+    """Test parsing with all full month names and abbreviations."""
+    months = MONTH_NAMES + MONTH_ABBREVIATIONS
+    results = {name: parse_source_folder_name(f"{name} 15, 2023") for name, _ in months}
+    expected = {name: (datetime(2023, num, 15), None) for name, num in months}
     
-    assert date == datetime(2023, month_num, 20)
-    assert description is None
+    assert results == expected
 
 
 @pytest.mark.parametrize("folder_name", [
@@ -95,7 +90,7 @@ def test_parse_source_folder_month_abbreviations(abbrev, month_num):
     "SEPTEMBER 10, 2022",
     "September 10, 2022",
     "SePtEmBeR 10, 2022",
-])
+], ids=["lower", "upper", "title", "mixed"])
 def test_parse_source_folder_case_insensitive(folder_name):
     """Test that month names are case-insensitive."""
     date, description = parse_source_folder_name(folder_name)
@@ -164,7 +159,7 @@ def test_parse_source_folder_none_input():
 @pytest.mark.parametrize("folder_name", [
     "February 30, 2023",
     "April 31, 2023",
-])
+], ids=["feb30", "apr31"])
 def test_parse_source_folder_invalid_dates(folder_name):
     """Test that invalid dates return None."""
     date, description = parse_source_folder_name(folder_name)
@@ -196,6 +191,36 @@ def test_parse_source_folder_description_with_trailing_spaces():
     assert description == "My Photos"
 
 
+def test_parse_source_folder_skips_non_month_word():
+    """Test that a "Word DD, YYYY" run that is not a month does not hide a later date."""
+    folder_name = "Room 5, 2022 party, June 5, 2022"
+    date, description = parse_source_folder_name(folder_name)
+    
+    assert date == datetime(2022, 6, 5)
+    assert description == "Room 5, 2022 party"
+
+
+def test_parse_source_precompiled():
+    """Test that the source folder pattern is compiled once at module level."""
+    assert isinstance(verify_backup_module._SOURCE_DATE_RE, re.Pattern)
+
+
+def test_parse_source_folder_description_trailing_unicode_space():
+    """Test that Unicode whitespace before the date is stripped like ASCII spaces."""
+    date, description = parse_source_folder_name("Beach Day\xa0, September 10, 2022")
+    
+    assert date == datetime(2022, 9, 10)
+    assert description == "Beach Day"
+
+
+def test_parse_source_folder_description_trailing_dashes():
+    """Test that mixed trailing separators are stripped from the description."""
+    date, description = parse_source_folder_name("Beach Day -, - September 10, 2022")
+    
+    assert date == datetime(2022, 9, 10)
+    assert description == "Beach Day"
+
+
 # Tests for parse_destination_folder_name
 
 def test_parse_destination_folder_with_description():
@@ -225,7 +250,7 @@ def test_parse_destination_folder_with_simple_description():
     assert description == "Description"
 
 
-@pytest.mark.parametrize("month", range(1, 13))
+@pytest.mark.parametrize("month", range(1, 13), ids=lambda month: f"m{month:02d}")
 def test_parse_destination_folder_all_months(month):
     """Test parsing with all months."""
     folder_name = f"2023-{month:02d}-15"
@@ -319,7 +344,9 @@ def test_parse_destination_folder_none_input():
     "2023-13-15",
     "2023-09-00",
     "2023-09-32",
-])
+    "1900-02-29",
+    "0000-01-15",
+], ids=["feb30", "apr31", "mon0", "mon13", "day0", "day32", "feb29_1900", "year0"])
 def test_parse_destination_folder_invalid_dates(folder_name):
     """Test that invalid dates return None."""
     date, description = parse_destination_folder_name(folder_name)
@@ -379,28 +406,28 @@ def test_parse_destination_folder_non_leap_year_february_29():
 # Tests for should_ignore_file
 
 
-def test_should_ignore_file_matches_criteria(tmp_path):
+def test_should_ignore_file_matches_criteria(tmp_path, make_sized_file):
     """Test that files starting with ._ and < 4KB are ignored."""
     # Create a small file starting with ._
     test_file = tmp_path / "._test_file"
-    test_file.write_bytes(b"x" * 1000)  # 1KB file
+    make_sized_file(test_file, 1000)  # 1KB file
     
     assert should_ignore_file(test_file) is True
 
 
-def test_should_ignore_file_too_large(tmp_path):
+def test_should_ignore_file_too_large(tmp_path, make_sized_file):
     """Test that files starting with ._ but >= 4KB are not ignored."""
     # Create a large file starting with ._
     test_file = tmp_path / "._large_file"
-    test_file.write_bytes(b"x" * 5000)  # 5KB file
+    make_sized_file(test_file, 5000)  # 5KB file
     
     assert should_ignore_file(test_file) is False
 
 
-def test_should_ignore_file_normal_file(tmp_path):
+def test_should_ignore_file_normal_file(tmp_path, make_sized_file):
     """Test that normal files are not ignored."""
     test_file = tmp_path / "normal_file.txt"
-    test_file.write_bytes(b"x" * 1000)
+    make_sized_file(test_file, 1000)
     
     assert should_ignore_file(test_file) is False
 
@@ -424,11 +451,9 @@ def test_scan_source_folders_valid_folders(tmp_path):
     folders = scan_source_folders(tmp_path)
     
     assert len(folders) == 2
-    # Dates are normalized to midnight
-    date_key_1 = datetime(2022, 9, 10).replace(hour=0, minute=0, second=0, microsecond=0)
-    date_key_2 = datetime(2023, 1, 5).replace(hour=0, minute=0, second=0, microsecond=0)
-    assert date_key_1 in folders
-    assert date_key_2 in folders
+    # Dates are keyed at midnight
+    assert datetime(2022, 9, 10) in folders
+    assert datetime(2023, 1, 5) in folders
 
 
 def test_scan_source_folders_nonexistent_path():
@@ -439,6 +464,15 @@ def test_scan_source_folders_nonexistent_path():
     assert len(folders) == 0
 
 
+def test_scan_source_folders_file_path(tmp_path):
+    """Test scanning a path that is a file returns empty dict."""
+    file_path = tmp_path / "not_a_folder.txt"
+    file_path.touch()
+    folders = scan_source_folders(file_path)
+    
+    assert folders == {}
+
+
 def test_scan_source_folders_empty_directory(tmp_path):
     """Test scanning empty directory returns empty dict."""
     folders = scan_source_folders(tmp_path)
@@ -449,7 +483,7 @@ def test_scan_source_folders_empty_directory(tmp_path):
 def test_scan_source_folders_ignores_files(tmp_path):
     """Test that files are ignored, only directories are scanned."""
     (tmp_path / "September 10, 2022").mkdir()
-    (tmp_path / "some_file.txt").write_text("test")
+    (tmp_path / "some_file.txt").touch()
     
     folders = scan_source_folders(tmp_path)
     
@@ -470,11 +504,10 @@ def test_scan_destination_folders_valid_folders(tmp_path):
     folders = scan_destination_folders(tmp_path)
     
     assert len(folders) == 2  # Two unique dates
-    assert datetime(2022, 9, 10).replace(hour=0, minute=0, second=0, microsecond=0) in folders
-    assert datetime(2023, 1, 5).replace(hour=0, minute=0, second=0, microsecond=0) in folders
+    assert datetime(2022, 9, 10) in folders
+    assert datetime(2023, 1, 5) in folders
     # Check that both 2022-09-10 folders are grouped together
-    date_key = datetime(2022, 9, 10).replace(hour=0, minute=0, second=0, microsecond=0)
-    assert len(folders[date_key]) == 2
+    assert len(folders[datetime(2022, 9, 10)]) == 2
 
 
 def test_scan_destination_folders_nonexistent_path():
@@ -500,16 +533,12 @@ def test_get_files_in_folder_basic(tmp_path):
     folder = tmp_path / "test_folder"
     folder.mkdir()
     
-    (folder / "file1.txt").write_text("content1")
-    (folder / "file2.txt").write_text("content2")
+    (folder / "file1.txt").write_bytes(b"a")
+    (folder / "file2.txt").write_bytes(b"ab")
     
     files = get_files_in_folder(folder)
     
-    assert len(files) == 2
-    assert "file1.txt" in files
-    assert "file2.txt" in files
-    assert files["file1.txt"] > 0
-    assert files["file2.txt"] > 0
+    assert files == {"file1.txt": 1, "file2.txt": 2}
 
 
 def test_get_files_in_folder_with_subdirectories(tmp_path):
@@ -519,8 +548,8 @@ def test_get_files_in_folder_with_subdirectories(tmp_path):
     subfolder = folder / "subfolder"
     subfolder.mkdir()
     
-    (folder / "file1.txt").write_text("content1")
-    (subfolder / "file2.txt").write_text("content2")
+    (folder / "file1.txt").touch()
+    (subfolder / "file2.txt").touch()
     
     files = get_files_in_folder(folder)
     
@@ -529,18 +558,32 @@ def test_get_files_in_folder_with_subdirectories(tmp_path):
     assert "subfolder/file2.txt" in files
 
 
-def test_get_files_in_folder_ignores_deleted_files(tmp_path):
+@pytest.mark.parametrize("name,size,ignored", [
+    ("._small", 4499, True),
+    ("._boundary", 4500, False),
+    ("small.txt", 10, False),
+], ids=["below_threshold", "at_threshold", "no_prefix"])
+def test_get_files_in_folder_ignore_threshold(tmp_path, make_sized_file, name, size, ignored):
+    """Test that get_files_in_folder applies the delete_by_filename size rule."""
+    make_sized_file(tmp_path / name, size)
+    
+    files = get_files_in_folder(tmp_path, ignore_deleted_files=True)
+    
+    assert (name not in files) is ignored
+
+
+def test_get_files_in_folder_ignores_deleted_files(tmp_path, make_sized_file):
     """Test that deleted files are ignored when flag is set."""
     folder = tmp_path / "test_folder"
     folder.mkdir()
     
     # Create a file that should be ignored
     ignored_file = folder / "._ignored"
-    ignored_file.write_bytes(b"x" * 1000)  # Small ._ file
+    make_sized_file(ignored_file, 1000)  # Small ._ file
     
     # Create a normal file
     normal_file = folder / "normal.txt"
-    normal_file.write_text("content")
+    normal_file.touch()
     
     files_without_ignore = get_files_in_folder(folder, ignore_deleted_files=False)
     files_with_ignore = get_files_in_folder(folder, ignore_deleted_files=True)
@@ -559,223 +602,261 @@ def test_get_files_in_folder_nonexistent_path():
     assert len(files) == 0
 
 
+def test_get_files_in_folder_skips_file_removed_during_scan(tmp_path, monkeypatch):
+    """Test that a file removed between listing and stat() does not drop the other files."""
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (tmp_path / name).write_text("content")
+    real_iter_files = verify_backup_module.iter_files
+    
+    def remove_after_first(root, unreadable=None):
+        # The directory has been read by the time the first entry is yielded
+        walk = real_iter_files(root, unreadable=unreadable)
+        yield next(walk)
+        removed = next(walk)
+        Path(removed.path).unlink()
+        yield removed
+        yield from walk
+    
+    monkeypatch.setattr(verify_backup_module, "iter_files", remove_after_first)
+    
+    files = get_files_in_folder(tmp_path)
+    
+    assert len(files) == 2
+    assert len(list(tmp_path.iterdir())) == 2
+    assert set(files) == {p.name for p in tmp_path.iterdir()}
+
+
 # Tests for verify_backup
 
+NOT_FOUND = 'File not found in any destination folder'
+
+# Each scenario describes a source and destination tree as
+# {folder name: {file name: content}} plus the expected verification results.
+SCENARIOS = [
+    {
+        'name': 'perfect_match',
+        'source': {"September 10, 2022": {"file1.txt": "content1", "file2.txt": "content2"}},
+        'dest': {"2022-09-10": {"file1.txt": "content1", "file2.txt": "content2"}},
+        'expected': {'folders_checked': 1, 'folders_matched': 1,
+                     'total_source_files': 2, 'total_dest_files': 2},
+    },
+    {
+        # file2.txt is missing in destination
+        'name': 'missing_files',
+        'source': {"September 10, 2022": {"file1.txt": "content1", "file2.txt": "content2"}},
+        'dest': {"2022-09-10": {"file1.txt": "content1"}},
+        'expected': {'folders_checked': 1, 'folders_matched': 0,
+                     'total_source_files': 2, 'total_dest_files': 1},
+        'missing': [("file2.txt", NOT_FOUND)],
+    },
+    {
+        'name': 'size_mismatch',
+        'source': {"September 10, 2022": {"file1.txt": "content1"}},
+        'dest': {"2022-09-10": {"file1.txt": "different content"}},
+        'expected': {'folders_checked': 1, 'folders_matched': 0,
+                     'total_source_files': 1, 'total_dest_files': 1},
+        'missing': [("file1.txt", 'Size mismatch')],
+    },
+    {
+        # No matching destination folder, so the source folder is not checked
+        'name': 'unmatched_folder',
+        'source': {"September 10, 2022": {"file1.txt": "content1"}},
+        'dest': {},
+        'expected': {'folders_checked': 0, 'folders_matched': 0,
+                     'total_source_files': 0, 'total_dest_files': 0},
+        'unmatched': ['No matching destination folder'],
+    },
+    {
+        'name': 'multiple_folders',
+        'source': {"September 10, 2022": {"file1.txt": "content"},
+                   "January 5, 2023": {"file2.txt": "content"}},
+        'dest': {"2022-09-10": {"file1.txt": "content"},
+                 "2023-01-05": {"file2.txt": "content"}},
+        'expected': {'folders_checked': 2, 'folders_matched': 2,
+                     'total_source_files': 2, 'total_dest_files': 2},
+    },
+    {
+        # Files are found if they exist in at least one destination folder
+        # for the date, not all of them
+        'name': 'multiple_dest_folders_same_date',
+        'source': {"September 10, 2022": {"file1.txt": "content1", "file2.txt": "content2",
+                                          "file3.txt": "content3"}},
+        'dest': {"2022-09-10_backup1": {"file1.txt": "content1", "file2.txt": "content2"},
+                 "2022-09-10_backup2": {"file2.txt": "content2", "file3.txt": "content3"}},
+        'expected': {'folders_checked': 1, 'folders_matched': 1,
+                     'total_source_files': 3, 'total_dest_files': 4},
+        'matched_in_dest': [2, 2],
+    },
+    {
+        # file3 is missing from both destination folders
+        'name': 'multiple_dest_folders_missing_file',
+        'source': {"September 10, 2022": {"file1.txt": "content1", "file2.txt": "content2",
+                                          "file3.txt": "content3"}},
+        'dest': {"2022-09-10_backup1": {"file1.txt": "content1"},
+                 "2022-09-10_backup2": {"file2.txt": "content2"}},
+        'expected': {'folders_checked': 1, 'folders_matched': 0,
+                     'total_source_files': 3, 'total_dest_files': 2},
+        'missing': [("file3.txt", NOT_FOUND)],
+    },
+]
 
-def test_verify_backup_perfect_match(tmp_path):
-    """Test verification when all files match."""
-    source = tmp_path / "source"
-    dest = tmp_path / "dest"
-    source.mkdir()
-    dest.mkdir()
+
+def _patch_scans(monkeypatch, scenario: dict) -> None:
+    """Serve a scenario's trees from memory instead of the filesystem.
     
-    # Create matching folders
-    source_folder = source / "September 10, 2022"
-    dest_folder = dest / "2022-09-10"
-    source_folder.mkdir()
-    dest_folder.mkdir()
+    Replaces scan_source_folders, scan_destination_folders and
+    get_files_in_folder so verify_backup's reconciliation runs without disk I/O.
+    """
+    listings = {}
     
-    # Create matching files
-    (source_folder / "file1.txt").write_text("content1")
-    (source_folder / "file2.txt").write_text("content2")
-    (dest_folder / "file1.txt").write_text("content1")
-    (dest_folder / "file2.txt").write_text("content2")
+    def by_date(root: Path, folders: dict, parse_func) -> dict:
+        folders_by_date = {}
+        for folder_name, files in folders.items():
+            folder = root / folder_name
+            listings[folder] = {name: len(content) for name, content in files.items()}
+            folders_by_date.setdefault(parse_func(folder_name)[0], []).append(folder)
+        return folders_by_date
     
-    results = verify_backup(source, dest)
+    source_folders = by_date(Path("source"), scenario['source'], parse_source_folder_name)
+    dest_folders = by_date(Path("dest"), scenario['dest'], parse_destination_folder_name)
     
-    assert results['folders_checked'] == 1
-    assert results['folders_matched'] == 1
-    assert len(results['missing_files']) == 0
-    assert len(results['folders_unmatched']) == 0
-    assert results['total_source_files'] == 2
-    assert results['total_dest_files'] == 2
+    monkeypatch.setattr(verify_backup_module, "scan_source_folders", lambda path: source_folders)
+    monkeypatch.setattr(verify_backup_module, "scan_destination_folders", lambda path: dest_folders)
+    monkeypatch.setattr(verify_backup_module, "get_files_in_folder",
+                        lambda folder, ignore_deleted_files=False, unreadable=None: dict(listings[folder]))
 
 
-def test_verify_backup_missing_files(tmp_path):
-    """Test verification when files are missing."""
-    source = tmp_path / "source"
-    dest = tmp_path / "dest"
-    source.mkdir()
-    dest.mkdir()
-    
-    source_folder = source / "September 10, 2022"
-    dest_folder = dest / "2022-09-10"
-    source_folder.mkdir()
-    dest_folder.mkdir()
+def _assert_results(results: dict, scenario: dict) -> None:
+    """Check verify_backup results against a scenario's expectations."""
+    for key, value in scenario['expected'].items():
+        assert results[key] == value, key
     
-    (source_folder / "file1.txt").write_text("content1")
-    (source_folder / "file2.txt").write_text("content2")
-    (dest_folder / "file1.txt").write_text("content1")
-    # file2.txt is missing in destination
+    missing = [(m['filename'], m['reason']) for m in results['missing_files']]
+    assert missing == scenario.get('missing', [])
+    for m in results['missing_files']:
+        if m['reason'] == 'Size mismatch':
+            assert 'dest_size' in m
     
-    results = verify_backup(source, dest)
+    unmatched = [u['reason'] for u in results['folders_unmatched']]
+    assert unmatched == scenario.get('unmatched', [])
     
-    assert results['folders_checked'] == 1
-    assert results['folders_matched'] == 0
-    assert len(results['missing_files']) == 1
-    assert results['missing_files'][0]['filename'] == "file2.txt"
+    if 'matched_in_dest' in scenario:
+        matched_in_dest = [d['matched_files_in_dest'] for d in results['folder_details']]
+        assert matched_in_dest == scenario['matched_in_dest']
 
 
-def test_verify_backup_size_mismatch(tmp_path):
-    """Test verification detects size mismatches."""
-    source = tmp_path / "source"
-    dest = tmp_path / "dest"
-    source.mkdir()
-    dest.mkdir()
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=[s['name'] for s in SCENARIOS])
+def test_verify_backup(scenario, monkeypatch):
+    """Test verification results for each source/dest scenario."""
+    _patch_scans(monkeypatch, scenario)
     
-    source_folder = source / "September 10, 2022"
-    dest_folder = dest / "2022-09-10"
-    source_folder.mkdir()
-    dest_folder.mkdir()
+    results = verify_backup(Path("source"), Path("dest"))
     
-    (source_folder / "file1.txt").write_text("content1")
-    (dest_folder / "file1.txt").write_text("different content")  # Different size
+    _assert_results(results, scenario)
+
+
+def test_verify_backup_workers_keep_date_order(monkeypatch):
+    """Test that verifying dates on a thread pool gives the same results as sequential."""
+    scenario = next(s for s in SCENARIOS if s['name'] == 'multiple_folders')
+    _patch_scans(monkeypatch, scenario)
     
-    results = verify_backup(source, dest)
+    sequential = verify_backup(Path("source"), Path("dest"))
+    threaded = verify_backup(Path("source"), Path("dest"), max_workers=4)
     
-    assert len(results['missing_files']) == 1
-    assert results['missing_files'][0]['reason'] == 'Size mismatch'
-    assert 'dest_size' in results['missing_files'][0]
+    assert threaded == sequential
+    _assert_results(threaded, scenario)
 
 
-def test_verify_backup_unmatched_folder(tmp_path):
-    """Test verification when source folder has no destination match."""
-    source = tmp_path / "source"
-    dest = tmp_path / "dest"
-    source.mkdir()
-    dest.mkdir()
+def test_verify_backup_scans_dest_folder_once_per_date(monkeypatch):
+    """Test that a destination folder is listed once, however many source folders share its date."""
+    _patch_scans(monkeypatch, {
+        'source': {"Park, September 10, 2022": {"a.txt": "a"},
+                   "Beach, September 10, 2022": {"b.txt": "b"}},
+        'dest': {"2022-09-10": {"a.txt": "a", "b.txt": "b"}},
+    })
+    listed = []
+    get_files = verify_backup_module.get_files_in_folder
     
-    source_folder = source / "September 10, 2022"
-    source_folder.mkdir()
-    (source_folder / "file1.txt").write_text("content1")
+    def counting_get_files(folder, ignore_deleted_files=False, unreadable=None):
+        listed.append(folder.name)
+        return get_files(folder, ignore_deleted_files, unreadable)
     
-    # No matching destination folder
+    monkeypatch.setattr(verify_backup_module, "get_files_in_folder", counting_get_files)
     
-    results = verify_backup(source, dest)
+    results = verify_backup(Path("source"), Path("dest"))
     
-    assert results['folders_checked'] == 0  # Not checked because no match
-    assert len(results['folders_unmatched']) == 1
-    assert results['folders_unmatched'][0]['reason'] == 'No matching destination folder'
+    assert listed.count("2022-09-10") == 1
+    assert results['folders_matched'] == 2
+    assert results['total_dest_files'] == 4
 
 
-def test_verify_backup_ignores_deleted_files(tmp_path):
-    """Test verification ignores deleted files when flag is set."""
+def test_verify_backup_end_to_end_ignores_deleted_files(tmp_path, make_sized_file):
+    """Test verification on real folders, ignoring deleted files when flag is set."""
     source = tmp_path / "source"
     dest = tmp_path / "dest"
-    source.mkdir()
-    dest.mkdir()
-    
     source_folder = source / "September 10, 2022"
     dest_folder = dest / "2022-09-10"
-    source_folder.mkdir()
-    dest_folder.mkdir()
+    source_folder.mkdir(parents=True)
+    dest_folder.mkdir(parents=True)
     
     # Create files including one that should be ignored
-    (source_folder / "._ignored").write_bytes(b"x" * 1000)
-    (source_folder / "normal.txt").write_text("content")
-    (dest_folder / "normal.txt").write_text("content")
+    make_sized_file(source_folder / "._ignored", 1000)
+    (source_folder / "normal.txt").touch()
+    (dest_folder / "normal.txt").touch()
     # ._ignored is missing in dest, but should be ignored
     
     results = verify_backup(source, dest, ignore_deleted_files=True)
     
-    assert results['folders_matched'] == 1
-    assert len(results['missing_files']) == 0
+    _assert_results(results, {
+        'expected': {'folders_checked': 1, 'folders_matched': 1,
+                     'total_source_files': 1, 'total_dest_files': 1},
+    })
 
 
-def test_verify_backup_multiple_folders(tmp_path):
-    """Test verification with multiple folders."""
-    source = tmp_path / "source"
-    dest = tmp_path / "dest"
-    source.mkdir()
-    dest.mkdir()
-    
-    # Create multiple date folders
-    (source / "September 10, 2022").mkdir()
-    (source / "January 5, 2023").mkdir()
-    (dest / "2022-09-10").mkdir()
-    (dest / "2023-01-05").mkdir()
-    
-    (source / "September 10, 2022" / "file1.txt").write_text("content")
-    (source / "January 5, 2023" / "file2.txt").write_text("content")
-    (dest / "2022-09-10" / "file1.txt").write_text("content")
-    (dest / "2023-01-05" / "file2.txt").write_text("content")
-    
-    results = verify_backup(source, dest)
-    
-    assert results['folders_checked'] == 2
-    assert results['folders_matched'] == 2
-    assert len(results['missing_files']) == 0
+def _make_backup_with_subfolder(tmp_path: Path) -> Path:
+    """Create matching source and destination folders, each with a "sub" folder."""
+    for folder in (tmp_path / "source" / "September 10, 2022", tmp_path / "dest" / "2022-09-10"):
+        (folder / "sub").mkdir(parents=True)
+        (folder / "file1.txt").write_text("content1")
+        (folder / "sub" / "file2.txt").write_text("content2")
+    return tmp_path / "source" / "September 10, 2022" / "sub"
 
 
-def test_verify_backup_multiple_dest_folders_same_date(tmp_path):
-    """Test verification where source folder matches multiple destination folders.
-    
-    Files should be considered found if they exist in at least one destination folder,
-    not all of them.
-    """
-    source = tmp_path / "source"
-    dest = tmp_path / "dest"
-    source.mkdir()
-    dest.mkdir()
-    
-    # Create one source folder and multiple destination folders for the same date
-    (source / "September 10, 2022").mkdir()
-    (dest / "2022-09-10_backup1").mkdir()
-    (dest / "2022-09-10_backup2").mkdir()
-    
-    # Source folder has 3 files
-    (source / "September 10, 2022" / "file1.txt").write_text("content1")
-    (source / "September 10, 2022" / "file2.txt").write_text("content2")
-    (source / "September 10, 2022" / "file3.txt").write_text("content3")
+def test_verify_backup_unreadable_source_subfolder_not_matched(tmp_path, monkeypatch):
+    """Test that a source folder with an unreadable subfolder is reported, not counted as matched."""
+    unreadable = _make_backup_with_subfolder(tmp_path)
+    real_scandir = os.scandir
     
-    # First destination folder has file1 and file2
-    (dest / "2022-09-10_backup1" / "file1.txt").write_text("content1")
-    (dest / "2022-09-10_backup1" / "file2.txt").write_text("content2")
+    def scandir(path):
+        if path == str(unreadable):
+            raise PermissionError(13, "Permission denied", path)
+        return real_scandir(path)
     
-    # Second destination folder has file2 and file3
-    (dest / "2022-09-10_backup2" / "file2.txt").write_text("content2")
-    (dest / "2022-09-10_backup2" / "file3.txt").write_text("content3")
+    monkeypatch.setattr(verify_backup_module.os, "scandir", scandir)
     
-    results = verify_backup(source, dest)
+    results = verify_backup(tmp_path / "source", tmp_path / "dest")
     
-    # All files should be found (file1 in backup1, file2 in both, file3 in backup2)
     assert results['folders_checked'] == 1
-    assert results['folders_matched'] == 1
-    assert len(results['missing_files']) == 0
+    assert results['folders_matched'] == 0
+    assert len(results['folders_unmatched']) == 1
+    assert str(unreadable) in results['folders_unmatched'][0]['reason']
+    assert not any(d['matched'] for d in results['folder_details'])
 
 
-def test_verify_backup_multiple_dest_folders_missing_file(tmp_path):
-    """Test verification where a file is missing from all destination folders."""
-    source = tmp_path / "source"
-    dest = tmp_path / "dest"
-    source.mkdir()
-    dest.mkdir()
-    
-    # Create one source folder and multiple destination folders for the same date
-    (source / "September 10, 2022").mkdir()
-    (dest / "2022-09-10_backup1").mkdir()
-    (dest / "2022-09-10_backup2").mkdir()
+def test_verify_backup_propagates_io_error(tmp_path, monkeypatch):
+    """Test that an I/O error while listing a folder aborts verification."""
+    failing = _make_backup_with_subfolder(tmp_path)
+    real_scandir = os.scandir
     
-    # Source folder has 3 files
-    (source / "September 10, 2022" / "file1.txt").write_text("content1")
-    (source / "September 10, 2022" / "file2.txt").write_text("content2")
-    (source / "September 10, 2022" / "file3.txt").write_text("content3")
+    def scandir(path):
+        if path == str(failing):
+            raise OSError(errno.EIO, "Input/output error", path)
+        return real_scandir(path)
     
-    # First destination folder has file1
-    (dest / "2022-09-10_backup1" / "file1.txt").write_text("content1")
+    monkeypatch.setattr(verify_backup_module.os, "scandir", scandir)
     
-    # Second destination folder has file2
-    (dest / "2022-09-10_backup2" / "file2.txt").write_text("content2")
-    
-    # file3 is missing from both destination folders
-    
-    results = verify_backup(source, dest)
-    
-    # file3 should be reported as missing
-    assert results['folders_checked'] == 1
-    assert results['folders_matched'] == 0
-    assert len(results['missing_files']) == 1
-    assert results['missing_files'][0]['filename'] == 'file3.txt'
+    with pytest.raises(OSError):
+        verify_backup(tmp_path / "source", tmp_path / "dest")
 
 
 # Tests for generate_report
@@ -9,13 +9,18 @@ filename and size.
 
 import argparse
 import logging
+import os
 import re
 import sys
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from delete_by_filename import DELETABLE_PREFIX, is_deletable
+from file_walk import iter_files
+
 
 # Month name mappings (full names and abbreviations)
 MONTH_NAMES = {
@@ -33,7 +38,52 @@ MONTH_NAMES = {
     'december': 12, 'dec': 12,
 }
 
+# MONTH_NAMES keyed by the usual spellings ("sep", "Sep", "SEP"), so most
+# folder names resolve their month without lowercasing the word first
+_MONTH_LOOKUP = {
+    variant: number
+    for name, number in MONTH_NAMES.items()
+    for variant in (name, name.capitalize(), name.upper())
+}
+
+# Source date pattern: Word DD, YYYY
+# Captures any alphabetic word before the date; it is checked against
+# MONTH_NAMES afterwards, which is cheaper than a 24-way alternation.
+_SOURCE_DATE_RE = re.compile(
+    r'\b(?P<month>[A-Za-z]+)\s+(?P<day>\d{1,2}),\s*(?P<year>\d{4})\b'
+)
+
+
+# Days in each month of a non-leap year (index 0 unused)
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _strip_trailing_separators(text: str) -> str:
+    """Remove trailing commas, dashes and whitespace from a description.
+    
+    Equivalent to re.sub(r'[,\\s-]+$', '', text): whitespace is anything
+    str.isspace() accepts, including Unicode spaces such as U+00A0.
+    """
+    end = len(text)
+    while end and (text[end - 1] in ',-' or text[end - 1].isspace()):
+        end -= 1
+    return text[:end]
 
+
+def _is_valid_date(year: int, month: int, day: int) -> bool:
+    """Check that year/month/day form a real calendar date.
+    
+    Uses a days-per-month table so invalid folder names are rejected without
+    raising and catching ValueError from datetime().
+    """
+    if year < 1 or month < 1 or month > 12 or day < 1:
+        return False
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return day <= 29
+    return day <= _DAYS_IN_MONTH[month]
+
+
+@lru_cache(maxsize=4096)
 def parse_source_folder_name(folder_name: str) -> Tuple[Optional[datetime], Optional[str]]:
     """Parse source folder name to extract date and description.
     
@@ -49,47 +99,36 @@ def parse_source_folder_name(folder_name: str) -> Tuple[Optional[datetime], Opti
         Tuple of (date, description) where:
         - date: datetime object with the extracted date, or None if parsing fails
         - description: string description extracted from folder name, or None if not found
+        
+    Results are cached, since the same folder names recur across scans.
     """
     if not folder_name:
         return None, None
     
-    # Pattern to match: Month DD, YYYY
-    # Handles full month names and abbreviations
-    # Allows for optional leading text (description)
-    month_pattern = '|'.join(MONTH_NAMES.keys())
-    date_pattern = rf'\b({month_pattern})\s+(\d{{1,2}}),\s*(\d{{4}})\b'
-    
-    # Case-insensitive search
-    match = re.search(date_pattern, folder_name, re.IGNORECASE)
-    
-    if not match:
-        return None, None
-    
-    month_name = match.group(1).lower()
-    day = int(match.group(2))
-    year = int(match.group(3))
-    
-    # Get month number
-    month = MONTH_NAMES.get(month_name)
-    if not month:
+    # Search for Month DD, YYYY, skipping "Word DD, YYYY" runs where the
+    # word is not a month name. Allows for optional leading text (description)
+    for match in _SOURCE_DATE_RE.finditer(folder_name):
+        word = match.group('month')
+        month = _MONTH_LOOKUP.get(word) or MONTH_NAMES.get(word.lower())
+        if month:
+            break
+    else:
         return None, None
     
-    # Validate day (basic check)
-    if day < 1 or day > 31:
-        return None, None
+    day = int(match.group('day'))
+    year = int(match.group('year'))
     
-    try:
-        date = datetime(year, month, day)
-    except ValueError:
-        # Invalid date (e.g., February 30)
+    # Reject invalid dates (e.g., February 30)
+    if not _is_valid_date(year, month, day):
         return None, None
+    date = datetime(year, month, day)
     
     # Extract description (everything before the date)
     date_start = match.start()
     description = folder_name[:date_start].strip()
     
     # Clean up description: remove trailing commas, dashes, spaces
-    description = re.sub(r'[,\s-]+$', '', description)
+    description = _strip_trailing_separators(description)
     
     # Return None for description if it's empty or just whitespace
     if not description:
@@ -98,6 +137,7 @@ def parse_source_folder_name(folder_name: str) -> Tuple[Optional[datetime], Opti
     return date, description
 
 
+@lru_cache(maxsize=4096)
 def parse_destination_folder_name(folder_name: str) -> Tuple[Optional[datetime], Optional[str]]:
     """Parse destination folder name to extract date and optional description.
     
@@ -113,44 +153,37 @@ def parse_destination_folder_name(folder_name: str) -> Tuple[Optional[datetime],
         Tuple of (date, description) where:
         - date: datetime object with the extracted date, or None if parsing fails
         - description: string description extracted from folder name, or None if not found
+        
+    Results are cached, since the same folder names recur across scans.
     """
     if not folder_name:
         return None, None
     
-    # Pattern to match: YYYY-MM-DD optionally followed by underscore and description
-    date_pattern = r'^(\d{4})-(\d{2})-(\d{2})(?:_(.*))?$'
-    
-    match = re.match(date_pattern, folder_name)
-    
-    if not match:
+    # Fixed-width YYYY-MM-DD prefix: check separators and digits by position
+    # instead of running a regex
+    if len(folder_name) < 10 or folder_name[4] != '-' or folder_name[7] != '-':
         return None, None
+    for i in (0, 1, 2, 3, 5, 6, 8, 9):
+        digit = ord(folder_name[i]) - 48
+        if digit < 0 or digit > 9:
+            return None, None
     
-    year = int(match.group(1))
-    month = int(match.group(2))
-    day = int(match.group(3))
-    description = match.group(4)
+    year = int(folder_name[:4])
+    month = int(folder_name[5:7])
+    day = int(folder_name[8:10])
     
-    # Validate month and day ranges
-    if month < 1 or month > 12:
-        return None, None
-    if day < 1 or day > 31:
+    # Reject invalid dates (e.g., 2022-02-30 or month 13)
+    if not _is_valid_date(year, month, day):
         return None, None
+    date = datetime(year, month, day)
     
-    try:
-        date = datetime(year, month, day)
-    except ValueError:
-        # Invalid date (e.g., 2022-02-30)
+    # Optional underscore followed by description
+    if len(folder_name) == 10:
+        return date, None
+    if folder_name[10] != '_':
         return None, None
     
-    # Clean up description if present
-    if description:
-        description = description.strip()
-        if not description:
-            description = None
-    else:
-        description = None
-    
-    return date, description
+    return date, folder_name[11:].strip() or None
 
 
 def should_ignore_file(file_path: Path) -> bool:
@@ -160,6 +193,9 @@ def should_ignore_file(file_path: Path) -> bool:
     - Start with '._'
     - Are 4KB or smaller (< 4500 bytes)
     
+    The rule itself lives in delete_by_filename.is_deletable; this wrapper
+    only adds the stat() call for callers that don't have the size yet.
+    
     Args:
         file_path: Path to the file to check
         
@@ -167,9 +203,10 @@ def should_ignore_file(file_path: Path) -> bool:
         True if file should be ignored, False otherwise
     """
     try:
-        file_name = file_path.name
-        file_size = file_path.stat().st_size
-        return file_name.startswith("._") and file_size < 4500
+        # Check the name first so most files never need a stat() call
+        if not file_path.name.startswith(DELETABLE_PREFIX):
+            return False
+        return is_deletable(file_path.name, file_path.stat().st_size)
     except (OSError, AttributeError):
         return False
 
@@ -189,21 +226,29 @@ def _scan_folders_by_date(
     Returns:
         Dictionary mapping dates to lists of folder paths
     """
-    folders_by_date: Dict[datetime, List[Path]] = defaultdict(list)
+    folders_by_date: Dict[datetime, List[Path]] = {}
     
-    if not root_path.exists() or not root_path.is_dir():
+    # Let scandir report a missing root instead of probing it with two stat() calls
+    try:
+        entries = os.scandir(root_path)
+    except (FileNotFoundError, NotADirectoryError):
         logging.warning(f"{folder_type.capitalize()} path does not exist or is not a directory: {root_path}")
-        return folders_by_date
-    
-    for item in root_path.iterdir():
-        if item.is_dir():
-            date, _ = parse_func(item.name)
-            if date:
-                # Normalize date to midnight for matching
-                date_key = date.replace(hour=0, minute=0, second=0, microsecond=0)
-                folders_by_date[date_key].append(item)
-            else:
-                logging.debug(f"Skipping {folder_type} folder (could not parse date): {item.name}")
+        return {}
+    
+    with entries:
+        for entry in entries:
+            if entry.is_dir():
+                date, _ = parse_func(entry.name)
+                if date:
+                    # Normalize date to midnight for matching
+                    date_key = date.replace(hour=0, minute=0, second=0, microsecond=0)
+                    date_folders = folders_by_date.get(date_key)
+                    if date_folders is None:
+                        folders_by_date[date_key] = [Path(entry.path)]
+                    else:
+                        date_folders.append(Path(entry.path))
+                else:
+                    logging.debug(f"Skipping {folder_type} folder (could not parse date): {entry.name}")
     
     return folders_by_date
 
@@ -232,61 +277,49 @@ def scan_destination_folders(dest_path: Path) -> Dict[datetime, List[Path]]:
     return _scan_folders_by_date(dest_path, parse_destination_folder_name, "destination")
 
 
-def get_files_in_folder(folder_path: Path, ignore_deleted_files: bool = False) -> Dict[str, int]:
+def get_files_in_folder(folder_path: Path, ignore_deleted_files: bool = False,
+                        unreadable: Optional[List[str]] = None) -> Dict[str, int]:
     """Get all files in a folder with their sizes.
     
     Args:
         folder_path: Path to folder to scan
         ignore_deleted_files: If True, ignore files matching delete_by_filename criteria
+        unreadable: Optional list that folders skipped for lack of permission
+            are appended to, so callers can tell an incomplete listing apart
         
     Returns:
-        Dictionary mapping filenames to file sizes
+        Dictionary mapping filenames to file sizes (empty if the folder does not exist)
     """
     files: Dict[str, int] = {}
+    root = str(folder_path)
+    # Length of "root/" so relative keys can be sliced off entry.path
+    prefix_len = len(os.path.join(root, ""))
     
-    if not folder_path.exists() or not folder_path.is_dir():
-        return files
+    try:
+        walk = iter_files(root, unreadable=unreadable)
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
     
-    for item in folder_path.rglob('*'):
-        if item.is_file():
-            if ignore_deleted_files and should_ignore_file(item):
-                logging.debug(f"Ignoring file (matches delete_by_filename criteria): {item}")
-                continue
-            
-            # Use relative path from folder_path as key to handle subdirectories
-            rel_path = item.relative_to(folder_path)
-            files[str(rel_path)] = item.stat().st_size
+    for entry in walk:
+        try:
+            file_size = entry.stat().st_size
+        except FileNotFoundError:
+            # Removed after it was listed; there is nothing left to verify
+            logging.debug(f"File disappeared during scan: {entry.path}")
+            continue
+        if ignore_deleted_files and is_deletable(entry.name, file_size):
+            logging.debug(f"Ignoring file (matches delete_by_filename criteria): {entry.path}")
+            continue
+        
+        # Use relative path from folder_path as key to handle subdirectories
+        files[entry.path[prefix_len:]] = file_size
     
     return files
 
 
-def verify_backup(source_path: Path, dest_path: Path, 
-                  ignore_deleted_files: bool = False) -> Dict:
-    """Verify that all source files exist in destination folders.
-    
-    Args:
-        source_path: Root directory containing source folders
-        dest_path: Root directory containing destination folders
-        ignore_deleted_files: If True, ignore files matching delete_by_filename criteria
-        
-    Returns:
-        Dictionary containing verification results and statistics
-    """
-    logging.info(f"Starting backup verification")
-    logging.info(f"Source: {source_path}")
-    logging.info(f"Ignore deleted files: {ignore_deleted_files}")
-    
-    # Scan folders
-    logging.info("Scanning source folders...")
-    source_folders = scan_source_folders(source_path)
-    logging.info(f"Found {len(source_folders)} unique dates in source folders")
-    
-    logging.info("Scanning destination folders...")
-    dest_folders = scan_destination_folders(dest_path)
-    logging.info(f"Found {len(dest_folders)} unique dates in destination folders")
-    
-    # Results tracking
-    results = {
+def _new_results() -> Dict:
+    """Create an empty verification results dictionary."""
+    return {
         'folders_checked': 0,
         'folders_matched': 0,
         'folders_unmatched': [],
@@ -295,114 +328,206 @@ def verify_backup(source_path: Path, dest_path: Path,
         'total_source_files': 0,
         'total_dest_files': 0,
     }
+
+
+def _verify_date(date: datetime, source_folder_list: List[Path],
+                 dest_folder_list: List[Path], ignore_deleted_files: bool) -> Dict:
+    """Verify all source folders for one date against that date's destination folders.
     
-    # Match folders by date and verify files
-    for date, source_folder_list in source_folders.items():
-        date_str = date.strftime("%Y-%m-%d")
-        logging.info(f"\nProcessing date: {date_str}")
-        
-        if date not in dest_folders:
-            logging.warning(f"No destination folder found for date {date_str}")
-            for src_folder in source_folder_list:
-                results['folders_unmatched'].append({
-                    'date': date_str,
-                    'source_folder': str(src_folder),
-                    'reason': 'No matching destination folder'
-                })
-            continue
+    Dates share no folders, so this can run for several dates concurrently.
+    
+    Args:
+        date: Date the folders were matched on
+        source_folder_list: Source folders for this date
+        dest_folder_list: Destination folders for this date (empty if none)
+        ignore_deleted_files: If True, ignore files matching delete_by_filename criteria
         
-        # Process each source folder for this date
+    Returns:
+        Results dictionary covering this date only
+    """
+    results = _new_results()
+    date_str = date.strftime("%Y-%m-%d")
+    logging.info(f"\nProcessing date: {date_str}")
+    
+    if not dest_folder_list:
+        logging.warning(f"No destination folder found for date {date_str}")
         for src_folder in source_folder_list:
-            results['folders_checked'] += 1
-            logging.info(f"  Checking source folder: {src_folder.name}")
-            
-            # Get all files in source folder
-            source_files = get_files_in_folder(src_folder, ignore_deleted_files)
-            source_file_count = len(source_files)
-            results['total_source_files'] += source_file_count
-            logging.info(f"    Found {source_file_count} files in source folder")
-            
-            # Get all destination folders for this date
-            dest_folder_list = dest_folders[date]
-            
-            # Collect all files from all destination folders for this date
-            # Track which destination folder(s) each file is found in
-            all_dest_files: Dict[str, Dict[str, object]] = {}  # filename -> {size, folders: [list of folder paths]}
-            
-            for dest_folder in dest_folder_list:
-                logging.info(f"    Scanning destination folder: {dest_folder.name}")
-                
-                # Get all files in destination folder
-                dest_files = get_files_in_folder(dest_folder, ignore_deleted_files)
-                dest_file_count = len(dest_files)
-                results['total_dest_files'] += dest_file_count
-                logging.info(f"      Found {dest_file_count} files in destination folder")
-                
-                # Merge files into combined dictionary
-                for filename, size in dest_files.items():
-                    if filename not in all_dest_files:
-                        all_dest_files[filename] = {
-                            'size': size,
-                            'folders': [str(dest_folder)]
-                        }
-                    else:
-                        # File exists in multiple folders - check if size matches
-                        if all_dest_files[filename]['size'] == size:
-                            all_dest_files[filename]['folders'].append(str(dest_folder))
-                        else:
-                            # Size mismatch - keep the first one but note the conflict
-                            logging.warning(f"      Size mismatch for {filename} across destination folders")
-            
-            # Now check if each source file exists in at least one destination folder
-            missing = []
+            results['folders_unmatched'].append({
+                'date': date_str,
+                'source_folder': str(src_folder),
+                'reason': 'No matching destination folder'
+            })
+        return results
+    
+    # Scan each destination folder for this date once, keeping its string
+    # form and file listing for every source folder on the same date
+    dest_listings: List[Tuple[Path, str, Dict[str, int]]] = []
+    # Collect all files from all destination folders for this date
+    # Track which destination folder(s) each file is found in
+    all_dest_files: Dict[str, Dict[str, object]] = {}  # filename -> {size, folders: [list of folder paths]}
+    
+    for dest_folder in dest_folder_list:
+        dest_folder_str = str(dest_folder)
+        logging.info(f"    Scanning destination folder: {dest_folder.name}")
+        
+        # Get all files in destination folder
+        dest_files = get_files_in_folder(dest_folder, ignore_deleted_files)
+        logging.info(f"      Found {len(dest_files)} files in destination folder")
+        dest_listings.append((dest_folder, dest_folder_str, dest_files))
+        
+        # Merge files into combined dictionary
+        for filename, size in dest_files.items():
+            if filename not in all_dest_files:
+                all_dest_files[filename] = {
+                    'size': size,
+                    'folders': [dest_folder_str]
+                }
+            else:
+                # File exists in multiple folders - check if size matches
+                if all_dest_files[filename]['size'] == size:
+                    all_dest_files[filename]['folders'].append(dest_folder_str)
+                else:
+                    # Size mismatch - keep the first one but note the conflict
+                    logging.warning(f"      Size mismatch for {filename} across destination folders")
+    
+    dest_folder_strs = [dest_folder_str for _, dest_folder_str, _ in dest_listings]
+    # Destination files are counted once per source folder checked against them
+    dest_file_total = sum(len(dest_files) for _, _, dest_files in dest_listings)
+    
+    # Process each source folder for this date
+    for src_folder in source_folder_list:
+        src_folder_str = str(src_folder)
+        results['folders_checked'] += 1
+        logging.info(f"  Checking source folder: {src_folder.name}")
+        
+        # Get all files in source folder
+        unreadable: List[str] = []
+        source_files = get_files_in_folder(src_folder, ignore_deleted_files, unreadable)
+        source_file_count = len(source_files)
+        results['total_source_files'] += source_file_count
+        results['total_dest_files'] += dest_file_total
+        logging.info(f"    Found {source_file_count} files in source folder")
+        
+        # Now check if each source file exists in at least one destination folder.
+        # Set operations find the problem files; only those are visited below,
+        # in source order, to build the records.
+        not_found = source_files.keys() - all_dest_files.keys()
+        mismatched = {filename for filename in source_files.keys() & all_dest_files.keys()
+                      if all_dest_files[filename]['size'] != source_files[filename]}
+        problem_files = not_found | mismatched
+        missing = []
+        if problem_files:
             for filename, size in source_files.items():
-                if filename not in all_dest_files:
+                if filename not in problem_files:
+                    continue
+                if filename in not_found:
                     # File not found in any destination folder
                     missing.append({
                         'filename': filename,
                         'size': size,
-                        'source_folder': str(src_folder),
-                        'dest_folders': [str(folder) for folder in dest_folder_list],
+                        'source_folder': src_folder_str,
+                        'dest_folders': list(dest_folder_strs),
                         'reason': 'File not found in any destination folder'
                     })
-                elif all_dest_files[filename]['size'] != size:
+                else:
                     # File exists but size mismatch
                     missing.append({
                         'filename': filename,
                         'size': size,
                         'dest_size': all_dest_files[filename]['size'],
-                        'source_folder': str(src_folder),
+                        'source_folder': src_folder_str,
                         'dest_folders': all_dest_files[filename]['folders'],
                         'reason': 'Size mismatch'
                     })
+        
+        missing_count = len(missing)
+        if unreadable:
+            # Files in folders that could not be read were never compared
+            logging.warning(f"    ✗ {len(unreadable)} folder(s) could not be read")
+            results['folders_unmatched'].append({
+                'date': date_str,
+                'source_folder': src_folder_str,
+                'reason': f"Could not read folder(s): {', '.join(unreadable)}"
+            })
+        if not missing and not unreadable:
+            results['folders_matched'] += 1
+            logging.info(f"    ✓ All files verified across {len(dest_listings)} destination folder(s)")
+        elif missing:
+            logging.warning(f"    ✗ {missing_count} files missing or mismatched")
+            results['missing_files'].extend(missing)
+        
+        # Store folder details for each destination folder
+        for dest_folder, dest_folder_str, dest_files in dest_listings:
+            dest_file_count = len(dest_files)
             
-            missing_count = len(missing)
-            if not missing:
-                results['folders_matched'] += 1
-                logging.info(f"    ✓ All files verified across {len(dest_folder_list)} destination folder(s)")
+            # Count how many source files are in this specific destination folder
+            # with the same size: the (name, size) pairs both folders share
+            if source_files == dest_files:
+                files_in_this_dest = source_file_count
             else:
-                logging.warning(f"    ✗ {missing_count} files missing or mismatched")
-                results['missing_files'].extend(missing)
+                files_in_this_dest = len(source_files.items() & dest_files.items())
             
-            # Store folder details for each destination folder
-            for dest_folder in dest_folder_list:
-                dest_files = get_files_in_folder(dest_folder, ignore_deleted_files)
-                dest_file_count = len(dest_files)
-                
-                # Count how many source files are in this specific destination folder
-                files_in_this_dest = sum(1 for filename in source_files.keys() 
-                                        if filename in dest_files and dest_files[filename] == source_files[filename])
-                
-                results['folder_details'].append({
-                    'date': date_str,
-                    'source_folder': str(src_folder),
-                    'dest_folder': str(dest_folder),
-                    'source_file_count': source_file_count,
-                    'dest_file_count': dest_file_count,
-                    'matched_files_in_dest': files_in_this_dest,
-                    'missing_count': missing_count,
-                    'matched': missing_count == 0
-                })
+            results['folder_details'].append({
+                'date': date_str,
+                'source_folder': src_folder_str,
+                'dest_folder': dest_folder_str,
+                'source_file_count': source_file_count,
+                'dest_file_count': dest_file_count,
+                'matched_files_in_dest': files_in_this_dest,
+                'missing_count': missing_count,
+                'matched': missing_count == 0 and not unreadable
+            })
+    
+    return results
+
+
+def verify_backup(source_path: Path, dest_path: Path, 
+                  ignore_deleted_files: bool = False, max_workers: int = 1) -> Dict:
+    """Verify that all source files exist in destination folders.
+    
+    Args:
+        source_path: Root directory containing source folders
+        dest_path: Root directory containing destination folders
+        ignore_deleted_files: If True, ignore files matching delete_by_filename criteria
+        max_workers: Number of dates to verify concurrently. Listing folders is
+            I/O bound, so threads help on network or USB drives. Results keep
+            the same order either way.
+        
+    Returns:
+        Dictionary containing verification results and statistics
+    """
+    logging.info(f"Starting backup verification")
+    logging.info(f"Source: {source_path}")
+    logging.info(f"Ignore deleted files: {ignore_deleted_files}")
+    
+    # Scan folders
+    logging.info("Scanning source folders...")
+    source_folders = scan_source_folders(source_path)
+    logging.info(f"Found {len(source_folders)} unique dates in source folders")
+    
+    logging.info("Scanning destination folders...")
+    dest_folders = scan_destination_folders(dest_path)
+    logging.info(f"Found {len(dest_folders)} unique dates in destination folders")
+    
+    # Results tracking
+    results = _new_results()
+    
+    def verify_date(item: Tuple[datetime, List[Path]]) -> Dict:
+        date, source_folder_list = item
+        return _verify_date(date, source_folder_list, dest_folders.get(date, []),
+                            ignore_deleted_files)
+    
+    # Match folders by date and verify files
+    if max_workers > 1 and len(source_folders) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            date_results = list(executor.map(verify_date, source_folders.items()))
+    else:
+        date_results = map(verify_date, source_folders.items())
+    
+    # Merge per-date results in date order
+    for date_result in date_results:
+        for key, value in date_result.items():
+            results[key] += value
     
     return results
 
@@ -531,6 +656,9 @@ Examples:
   
   # Save log and report to files
   python verify_backup.py --source /path/to/source --destination /path/to/dest --log verify.log --report report.txt
+  
+  # Verify 8 dates at a time (useful on network drives)
+  python verify_backup.py --source /path/to/source --destination /path/to/dest --workers 8
         """
     )
     
@@ -566,6 +694,13 @@ Examples:
         help='Path to report file (optional)'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of dates to verify concurrently (default: 1)'
+    )
+    
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -596,7 +731,8 @@ Examples:
     
     # Run verification
     try:
-        results = verify_backup(args.source, args.destination, args.ignore_deleted)
+        results = verify_backup(args.source, args.destination, args.ignore_deleted,
+                                max_workers=args.workers)
         
         # Generate and display report
         report_text = generate_report(results, args.report)